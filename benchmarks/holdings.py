@@ -0,0 +1,58 @@
+import time
+from collections import defaultdict
+
+import numpy as np
+
+from py_debank_async.columnar import Holdings
+from py_debank_async.models import Chain
+from benchmarks import payloads
+
+
+def synthetic(count: int, addresses: int = 100_000, tokens: int = 5_000, chains: int = 6) -> Holdings:
+    random = np.random.default_rng(0)
+    token_chains = random.integers(0, chains, tokens)
+    token = random.integers(0, tokens, count, dtype=np.int32)
+    amount = random.exponential(100, count)
+    price = random.exponential(10, tokens)[token]
+    return Holdings(
+        addresses=[f'0x{index:040x}' for index in range(addresses)], chains=payloads.CHAINS[:chains],
+        tokens=[(int(token_chains[index]), f'0x{index:040x}') for index in range(tokens)],
+        address=random.integers(0, addresses, count, dtype=np.int32), chain=token_chains[token].astype(np.int16),
+        token=token, amount=amount, price=price, usd_value=amount * price
+    )
+
+
+def measure(name: str, function, *args) -> None:
+    started_at = time.perf_counter()
+    function(*args)
+    print(f'{name:<40} {(time.perf_counter() - started_at) * 1000:>10.1f} ms')
+
+
+def python_totals(chains: list) -> dict:
+    totals = defaultdict(float)
+    for chain in chains:
+        for token in chain.tokens:
+            totals[(chain.name, token.id)] += token.usd_value
+
+    return totals
+
+
+def main() -> None:
+    chains = [Chain(name='eth', tokens=payloads.tokens(count=100)) for _ in range(1_000)]
+    print('100k holdings of Token objects')
+    measure('Python loop totals', python_totals, chains)
+    holdings = Holdings.from_balances(
+        balances=[(f'0x{index:040x}', {'eth': chain}) for index, chain in enumerate(chains)]
+    )
+    measure('Holdings.totals_by_token', holdings.totals_by_token)
+
+    holdings = synthetic(count=10_000_000)
+    print(f'\n{len(holdings)} holdings')
+    measure('Holdings.totals_by_token', holdings.totals_by_token)
+    measure('Holdings.totals_by_address', holdings.totals_by_address)
+    measure('Holdings.without_dust', holdings.without_dust, 1.0)
+    measure('Holdings.top', holdings.top, 100)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+import json
+import sys
+import time
+from typing import Callable, Dict
+
+from benchmarks import payloads
+
+try:
+    import orjson
+
+except ImportError:
+    orjson = None
+
+
+def measure(decode: Callable[[bytes], object], body: bytes, repeat: int) -> float:
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        decode(body)
+
+    return (time.perf_counter() - started_at) / repeat * 1000
+
+
+def main() -> None:
+    """
+    Compare decoders on synthetic large payloads or on recorded response bodies passed as file paths.
+    """
+    if len(sys.argv) > 1:
+        bodies: Dict[str, bytes] = {}
+        for path in sys.argv[1:]:
+            with open(path, 'rb') as file:
+                bodies[path] = file.read()
+
+    else:
+        bodies = {
+            'portfolio/project_list': json.dumps({'error_code': 0, 'data': payloads.projects(count=300)}).encode(),
+            'history/list': json.dumps({'error_code': 0, 'data': payloads.history_page(count=20)}).encode(),
+            'token/balance_list': json.dumps({'error_code': 0, 'data': payloads.tokens(count=2_000)}).encode()
+        }
+
+    decoders = {
+        'response.json()': lambda body: json.loads(body.decode()),
+        'json.loads(bytes)': json.loads
+    }
+    if orjson:
+        decoders['orjson.loads'] = orjson.loads
+
+    print(f'{"Payload":<28} {"Size":>10} ' + ' '.join(f'{name:>18}' for name in decoders))
+    for name, body in bodies.items():
+        repeat = max(10, 20_000_000 // len(body))
+        timings = ' '.join(f'{measure(decode, body, repeat):>15.3f} ms' for decode in decoders.values())
+        print(f'{name:<28} {len(body) / 1024:>7.0f} KB {timings}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+import copy
+import gc
+import tracemalloc
+from typing import Callable
+
+from py_debank_async import compact, models
+from benchmarks import payloads
+
+
+def bytes_per_instance(create: Callable[[], object], count: int = 10_000) -> float:
+    """
+    Measure how much memory instances of a model take.
+
+    Args:
+        create (Callable[[], object]): a function creating an instance.
+        count (int): how many instances to create. (10000)
+
+    Returns:
+        float: the average number of bytes retained by an instance.
+
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [create() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del instances
+    return (after - before) / count
+
+
+def compare(name: str, regular: Callable[[], object], slotted: Callable[[], object]) -> None:
+    regular_size = bytes_per_instance(regular)
+    slotted_size = bytes_per_instance(slotted)
+    print(
+        f'{name:<12} {regular_size:>10.0f} B {slotted_size:>10.0f} B '
+        f'{(1 - slotted_size / regular_size) * 100:>8.1f}%'
+    )
+
+
+def main() -> None:
+    token = payloads.token(index=1)
+    collection = payloads.collection(index=1, nfts=0)
+    nft = payloads.nft(index=1)
+    nft_tx = payloads.nft_tx(index=1)
+    page = payloads.history_page(count=1)
+    tx = {**page['history_list'][0], 'address': '0x' + '2' * 40, 'project_dict': page['project_dict']}
+
+    print(f'{"Model":<12} {"models":>12} {"compact":>12} {"saved":>9}')
+    compare(
+        'Mark', lambda: models.Mark(timestamp=1700000000, usd_value=1.0),
+        lambda: compact.Mark(timestamp=1700000000, usd_value=1.0)
+    )
+    compare('Token', lambda: models.Token(data=token), lambda: compact.Token(data=token))
+    compare('Collection', lambda: models.Collection(data=collection), lambda: compact.Collection(data=collection))
+    compare('NFT', lambda: models.NFT(data=nft), lambda: compact.NFT(data=nft))
+    compare(
+        'NFTTx', lambda: models.NFTTx(chain='eth', data=nft_tx), lambda: compact.NFTTx(chain='eth', data=nft_tx)
+    )
+    compare(
+        'Tx', lambda: models.Tx(data={**tx, 'token_dict': copy.deepcopy(page['token_dict'])}),
+        lambda: compact.Tx(data={**tx, 'token_dict': copy.deepcopy(page['token_dict'])})
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Callable, List
+
+from py_debank_async import compact, models
+from benchmarks import payloads
+
+
+def parsers(size: int) -> List[tuple]:
+    """
+    Generate payloads of a certain size and functions building models from them.
+
+    Args:
+        size (int): how many tokens, portfolio items, NFTs, transactions or profits a payload holds.
+
+    Returns:
+        List[tuple]: names, functions and the number of items of the benchmarks.
+
+    """
+    tokens = payloads.tokens(count=size)
+    project = payloads.project(index=0, items=size)
+    collections = [payloads.collection(index=index, nfts=10) for index in range(max(size // 10, 1))]
+    page = payloads.history_page(count=size, distinct_tokens=min(size, 2_000))
+    profits = [payloads.profit(index=index) for index in range(size)]
+    return [
+        ('Chain.parse_tokens', lambda: models.Chain(name='eth', tokens=tokens), size),
+        ('Chain.parse_tokens (lazy)', lambda: models.Chain(name='eth', tokens=tokens, lazy=True), size),
+        ('Project.parse_items', lambda: models.Project(data=project), size),
+        ('Project.parse_items (lazy)', lambda: models.Project(data=project, lazy=True), size),
+        ('Chain.parse_nfts', lambda: models.Chain(name='eth', collections=collections), len(collections) * 10),
+        ('History.parse_txs', lambda: models.History(address='0x' + '2' * 40, data=page), size),
+        ('compact.History.parse_txs', lambda: compact.History(address='0x' + '2' * 40, data=page), size),
+        ('ProfitLeaderboard', lambda: models.ProfitLeaderboard(chain='eth', profits=profits), size)
+    ]
+
+
+def measure_time(function: Callable, min_time: float = 0.5) -> float:
+    runs = 0
+    started_at = time.perf_counter()
+    while True:
+        function()
+        runs += 1
+        elapsed = time.perf_counter() - started_at
+        if elapsed >= min_time:
+            return elapsed / runs
+
+
+def measure_memory(function: Callable) -> int:
+    gc.collect()
+    tracemalloc.start()
+    result = function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Time model constructors on synthetic payloads.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 1_000, 100_000], help='payload sizes')
+    parser.add_argument('--min-time', type=float, default=0.5, help='how long to repeat every benchmark')
+    parser.add_argument('--only', default='', help='run benchmarks whose names contain this string')
+    args = parser.parse_args()
+
+    print(f'{"Benchmark":<28} {"Size":>7} {"Time, ms":>10} {"Items/s":>12} {"Peak, KB":>12}')
+    for size in args.sizes:
+        for name, function, items in parsers(size=size):
+            if args.only not in name:
+                continue
+
+            elapsed = measure_time(function=function, min_time=args.min_time)
+            peak = measure_memory(function=function)
+            print(
+                f'{name:<28} {size:>7} {elapsed * 1000:>10.2f} {items / elapsed:>12.0f} {peak / 1024:>12.0f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
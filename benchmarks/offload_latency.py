@@ -0,0 +1,119 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import tempfile
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Optional, List
+
+from py_debank_async import portfolio, user
+from py_debank_async.client import DebankClient
+from benchmarks import payloads
+from benchmarks.server import USED_CHAINS
+from benchmarks.suite import ADDRESS, percentile, run_server, wait_for_port
+
+
+def write_large_payloads(directory: str, projects: int) -> int:
+    """
+    Write a large "project_list" response for the stand-in server.
+
+    Args:
+        directory (str): a directory of recorded responses.
+        projects (int): how many projects the response has.
+
+    Returns:
+        int: the size of the response in bytes.
+
+    """
+    data = [
+        payloads.project(index=index, items=5, chain=USED_CHAINS[index % len(USED_CHAINS)]) for index in range(projects)
+    ]
+    body = json.dumps({'error_code': 0, 'data': data})
+    with open(os.path.join(directory, 'portfolio_project_list.json'), 'w', encoding='utf-8') as file:
+        file.write(body)
+
+    return len(body)
+
+
+async def small_calls(client: DebankClient, interval: float, stop: asyncio.Event, latencies: List[float]) -> None:
+    while not stop.is_set():
+        started_at = time.perf_counter()
+        await user.total_balance(address=ADDRESS, client=client)
+        latencies.append(time.perf_counter() - started_at)
+        await asyncio.sleep(interval)
+
+
+async def large_calls(client: DebankClient, calls: int) -> None:
+    for _ in range(calls):
+        await portfolio.project_list(address=ADDRESS, client=client)
+
+
+async def measure(
+        base_url: str, executor: Optional[Executor], large: int, small_workers: int, interval: float
+) -> List[float]:
+    latencies = []
+    stop = asyncio.Event()
+    async with DebankClient(base_url=base_url, coalesce=False, executor=executor) as client:
+        await user.total_balance(address=ADDRESS, client=client)
+        await portfolio.project_list(address=ADDRESS, client=client)
+        workers = [
+            asyncio.create_task(small_calls(client=client, interval=interval, stop=stop, latencies=latencies))
+            for _ in range(small_workers)
+        ]
+        await large_calls(client=client, calls=large)
+        stop.set()
+        await asyncio.gather(*workers)
+
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Measure latency of small requests while large responses are parsed, with and without offloading.'
+    )
+    parser.add_argument('--projects', type=int, default=1000, help='projects in a large response')
+    parser.add_argument('--large', type=int, default=10, help='large responses parsed one after another')
+    parser.add_argument('--small-workers', type=int, default=5, help='loops making small requests')
+    parser.add_argument('--interval', type=float, default=0.005, help='pause between small requests in seconds')
+    parser.add_argument('--latency', type=float, default=0.005, help='response delay in seconds')
+    parser.add_argument('--port', type=int, default=8767)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        size = write_large_payloads(directory=directory, projects=args.projects)
+        server = multiprocessing.Process(
+            target=run_server, args=(args.latency, 0.0, directory, args.port), daemon=True
+        )
+        server.start()
+        try:
+            wait_for_port(port=args.port)
+            base_url = f'http://127.0.0.1:{args.port}/'
+            print(f'CPU cores: {multiprocessing.cpu_count()}, large response: {size / 1024 / 1024:.1f} MiB')
+            print(f'{"executor":<12} {"small calls":>11} {"p50, ms":>9} {"p99, ms":>9} {"max, ms":>9}')
+            executors = (('none', None), ('threads', ThreadPoolExecutor), ('processes', ProcessPoolExecutor))
+            for name, executor_class in executors:
+                executor = executor_class(max_workers=2) if executor_class else None
+                try:
+                    latencies = asyncio.run(measure(
+                        base_url=base_url, executor=executor, large=args.large, small_workers=args.small_workers,
+                        interval=args.interval
+                    ))
+
+                finally:
+                    if executor:
+                        executor.shutdown()
+
+                print(
+                    f'{name:<12} {len(latencies):>11} {percentile(latencies, 0.5) * 1000:>9.1f} '
+                    f'{percentile(latencies, 0.99) * 1000:>9.1f} {max(latencies) * 1000:>9.1f}'
+                )
+
+        finally:
+            server.terminate()
+            server.join()
+
+
+if __name__ == '__main__':
+    main()
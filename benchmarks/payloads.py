@@ -0,0 +1,150 @@
+import random
+from typing import List
+
+CHAINS = ['eth', 'bsc', 'arb', 'matic', 'op', 'avax']
+
+
+def token(index: int, chain: str = 'eth') -> dict:
+    """
+    Generate a raw token like the ones in the "balance_list" response.
+
+    Args:
+        index (int): an index of the token, it makes the token ID unique.
+        chain (str): a chain. (eth)
+
+    Returns:
+        dict: the token.
+
+    """
+    return {
+        'id': f'0x{index:040x}', 'chain': chain, 'name': f'Token {index}', 'symbol': f'T{index}',
+        'display_symbol': None, 'optimized_symbol': f'T{index}', 'decimals': 18,
+        'logo_url': f'https://static.debank.com/image/token/logo_url/{index}.png', 'protocol_id': '',
+        'price': random.uniform(0.0001, 2000), 'is_verified': True, 'is_core': True, 'is_wallet': True,
+        'time_at': 1600000000 + index, 'amount': random.uniform(0, 1000), 'raw_amount': 10 ** 18
+    }
+
+
+def tokens(count: int, chain: str = 'eth') -> List[dict]:
+    return [token(index=index, chain=chain) for index in range(count)]
+
+
+def collection(index: int, nfts: int = 1, chain: str = 'eth') -> dict:
+    """
+    Generate a raw NFT collection like the ones in the "collection_list" response.
+
+    Args:
+        index (int): an index of the collection.
+        nfts (int): how many NFTs the collection holds. (1)
+        chain (str): a chain. (eth)
+
+    Returns:
+        dict: the collection.
+
+    """
+    return {
+        'id': f'{chain}:0x{index:040x}', 'chain': chain, 'name': f'Collection {index}', 'amount': nfts,
+        'description': 'A synthetic collection.', 'is_core': True, 'is_visible': True, 'logo_url': '',
+        'floor_price': 0.1, 'avg_price_24h': 0.2, 'avg_price_last_24h': 0.2, 'floor_price_24h': 0.1,
+        'max_price_24h': 0.5, 'max_price_last_24h': 0.5, 'volume_24h': 10.0, 'volume_last_24h': 12.0,
+        'rank_at': index, 'thirdparty': {}, 'spent_token': token(index=index, chain=chain),
+        'nft_list': [nft(index=index * 1000 + nft_index, chain=chain) for nft_index in range(nfts)]
+    }
+
+
+def nft(index: int, chain: str = 'eth') -> dict:
+    return {
+        'id': f'0x{index:064x}', 'chain': chain, 'contract_id': f'0x{index // 1000:040x}', 'inner_id': str(index),
+        'name': f'NFT #{index}', 'content': '', 'content_type': 'image_url', 'detail_url': '',
+        'thumbnail_url': '', 'minter': '0x' + '1' * 40, 'amount': 1, 'collection_id': f'{chain}:{index // 1000}',
+        'mint_gas_token': token(index=0, chain=chain), 'mint_pay_token': token(index=1, chain=chain),
+        'pay_token': token(index=2, chain=chain)
+    }
+
+
+def nft_tx(index: int, chain: str = 'eth') -> dict:
+    return {
+        'id': f'{index}', 'chain': chain, 'type': 'buy', 'tx_id': f'0x{index:064x}', 'time_at': 1700000000 - index,
+        'user_addr': '0x' + '2' * 40, 'nft': nft(index=index, chain=chain), 'collection': collection(index=index),
+        'pay_token': token(index=index, chain=chain)
+    }
+
+
+def profit(index: int, chain: str = 'eth') -> dict:
+    return {
+        **collection(index=index, nfts=0, chain=chain), 'mint_count': 1, 'buy_count': 2, 'sell_count': 1,
+        'profit_token': token(index=index, chain=chain), 'spent_token': token(index=index + 1, chain=chain),
+        'revenue_token': token(index=index + 2, chain=chain)
+    }
+
+
+def portfolio_item(index: int, tokens_count: int = 2) -> dict:
+    return {
+        'name': 'Liquidity Pool', 'stats': {
+            'asset_usd_value': random.uniform(0, 10000), 'debt_usd_value': 0.0, 'net_usd_value': 0.0
+        },
+        'asset_dict': {}, 'detail_types': ['common'], 'pool': {'id': str(index)}, 'position_index': None,
+        'proxy_detail': {}, 'update_at': 1700000000,
+        'details': {'supply_token_list': [token(index=token_index) for token_index in range(tokens_count)]}
+    }
+
+
+def project(index: int, items: int = 3, chain: str = 'eth') -> dict:
+    return {
+        'id': f'project{index}', 'chain': chain, 'name': f'Project {index}', 'site_url': '', 'logo_url': '',
+        'has_supported_portfolio': True, 'is_tvl': True, 'is_visible_in_defi': True, 'tvl': 1e6,
+        'platform_token_id': None, 'tag_ids': [],
+        'portfolio_item_list': [portfolio_item(index=item_index) for item_index in range(items)]
+    }
+
+
+def projects(count: int, chain: str = 'eth') -> List[dict]:
+    return [project(index=index, chain=chain) for index in range(count)]
+
+
+def history_page(count: int, start_time: int = 1700000000, nfts_share: float = 0.1, distinct_tokens: int = 50,
+                 chain: str = 'eth') -> dict:
+    """
+    Generate a raw page of the "history/list" response.
+
+    Args:
+        count (int): how many transactions the page holds.
+        start_time (int): the time of the newest transaction. (1700000000)
+        nfts_share (float): a share of transfers that move NFTs. (0.1)
+        distinct_tokens (int): how many different tokens the transactions move. (50)
+        chain (str): a chain. (eth)
+
+    Returns:
+        dict: the page.
+
+    """
+    token_dict = {}
+    for index in range(distinct_tokens):
+        if random.random() < nfts_share:
+            item = nft(index=index, chain=chain)
+            item['pay_token'] = {'id': f'0x{index:040x}'}
+
+        else:
+            item = token(index=index, chain=chain)
+
+        token_dict[item['id']] = item
+
+    token_ids = list(token_dict)
+    history_list = []
+    for index in range(count):
+        history_list.append({
+            'id': f'0x{index:064x}', 'chain': chain, 'cate_id': random.choice(['send', 'receive', None]),
+            'time_at': start_time - index, 'other_addr': '0x' + '3' * 40, 'project_id': 'project0',
+            'tx': {
+                'name': 'swap', 'from_addr': '0x' + '2' * 40, 'to_addr': '0x' + '3' * 40, 'eth_gas_fee': 0.001,
+                'usd_gas_fee': 2.0
+            },
+            'sends': [{'token_id': random.choice(token_ids), 'amount': random.uniform(0, 10)}],
+            'receives': [{'token_id': random.choice(token_ids), 'amount': random.uniform(0, 10)}],
+            'token_approve': None
+        })
+
+    return {
+        'history_list': history_list, 'token_dict': token_dict, 'project_dict': {'project0': project(index=0, items=0)},
+        'cate_dict': {}
+    }
@@ -0,0 +1,44 @@
+import asyncio
+import os
+import tempfile
+import time
+
+from py_debank_async import custom
+from py_debank_async.client import DebankClient
+from py_debank_async.transport import RecordingTransport, ReplayTransport
+from benchmarks.server import StandInServer
+
+
+async def scan(client: DebankClient, addresses: int) -> float:
+    started_at = time.perf_counter()
+    await asyncio.gather(*(
+        custom.get_balance(address=f'0x{index:040x}', client=client) for index in range(addresses)
+    ))
+    return time.perf_counter() - started_at
+
+
+async def main(addresses: int = 200, latency: float = 0.1) -> None:
+    """
+    Record balances of many addresses from a stand-in server with a network-like latency and replay them.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'recording.jsonl')
+        async with StandInServer(latency=latency) as server:
+            async with DebankClient(base_url=server.base_url, transport=RecordingTransport(path=path)) as client:
+                elapsed = await scan(client=client, addresses=addresses)
+                print(
+                    f'Recorded {client.requests} requests in {elapsed:.2f} s '
+                    f'({os.path.getsize(path) / 2 ** 20:.1f} MB)'
+                )
+
+        started_at = time.perf_counter()
+        transport = ReplayTransport(path=path)
+        print(f'Loaded {len(transport)} responses in {time.perf_counter() - started_at:.2f} s')
+
+    async with DebankClient(transport=transport) as client:
+        elapsed = await scan(client=client, addresses=addresses)
+        print(f'Replayed {client.requests} requests in {elapsed:.2f} s ({client.requests / elapsed:.0f} requests/s)')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
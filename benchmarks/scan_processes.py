@@ -0,0 +1,69 @@
+import argparse
+import asyncio
+import multiprocessing
+import time
+from typing import Dict
+
+from py_debank_async import batch, custom
+from py_debank_async.client import DebankClient
+from py_debank_async.models import Chain
+from benchmarks.suite import run_server, wait_for_port
+
+
+def total_usd_value(chains: Dict[str, Chain]) -> float:
+    return sum(chain.usd_value for chain in chains.values())
+
+
+async def single_process(addresses: list, concurrency: int, base_url: str) -> float:
+    started_at = time.perf_counter()
+    async with DebankClient(base_url=base_url) as client:
+        async for _ in batch.scan(
+                addresses=addresses, operation=custom.get_balance, concurrency=concurrency, client=client
+        ):
+            pass
+
+    return time.perf_counter() - started_at
+
+
+async def sharded(addresses: list, processes: int, concurrency: int, base_url: str) -> float:
+    started_at = time.perf_counter()
+    async for _ in batch.scan_processes(
+            addresses=addresses, operation=custom.get_balance, processes=processes, concurrency=concurrency,
+            client_kwargs={'base_url': base_url}, transform=total_usd_value
+    ):
+        pass
+
+    return time.perf_counter() - started_at
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare scanning in one and several processes.')
+    parser.add_argument('--addresses', type=int, default=400)
+    parser.add_argument('--processes', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--concurrency', type=int, default=20, help='addresses handled at once by a process')
+    parser.add_argument('--latency', type=float, default=0.02, help='response delay in seconds')
+    parser.add_argument('--port', type=int, default=8766)
+    args = parser.parse_args()
+
+    server = multiprocessing.Process(target=run_server, args=(args.latency, 0.0, None, args.port), daemon=True)
+    server.start()
+    try:
+        wait_for_port(port=args.port)
+        base_url = f'http://127.0.0.1:{args.port}/'
+        addresses = [f'0x{index:040x}' for index in range(args.addresses)]
+        print(f'CPU cores: {multiprocessing.cpu_count()}, addresses: {args.addresses}')
+        elapsed = asyncio.run(single_process(addresses=addresses, concurrency=args.concurrency, base_url=base_url))
+        print(f'{"batch.scan":<28} {args.addresses / elapsed:>10.1f} addresses/s')
+        for processes in args.processes:
+            elapsed = asyncio.run(sharded(
+                addresses=addresses, processes=processes, concurrency=args.concurrency, base_url=base_url
+            ))
+            print(f'{f"batch.scan_processes({processes})":<28} {args.addresses / elapsed:>10.1f} addresses/s')
+
+    finally:
+        server.terminate()
+        server.join()
+
+
+if __name__ == '__main__':
+    main()
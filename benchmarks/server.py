@@ -0,0 +1,163 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+from typing import Optional, Dict
+
+from aiohttp import web
+
+from benchmarks import payloads
+
+USED_CHAINS = ['eth', 'bsc', 'arb']
+
+
+def synthetic_payloads() -> Dict[str, object]:
+    """
+    Generate the "data" of responses of every public endpoint.
+
+    Returns:
+        Dict[str, object]: the data by endpoints.
+
+    """
+    collections = [payloads.collection(index=index, nfts=3) for index in range(10)]
+    user = {
+        'id': '0x' + '2' * 40, 'used_chains': USED_CHAINS, 'usd_value': 1000.0, 'wallet_usd_value': 800.0,
+        'protocol_usd_value': 200.0, 'create_at': 1600000000, 'follower_count': 0, 'following_count': 0
+    }
+    return {
+        'asset/net_curve_24h': {
+            'usd_value_list': [[1700000000 + index * 300, 1000.0 + index] for index in range(288)]
+        },
+        'history/list': payloads.history_page(count=1_000, distinct_tokens=200),
+        'history/token_price': {'price': 1.0},
+        'nft/collection_list': {'job': None, 'result': {'data': collections}},
+        'nft/history_collection_list': {'job': None, 'result': {'data': collections}},
+        'nft/history_list': {'history_list': [payloads.nft_tx(index=index) for index in range(20)]},
+        'nft/used_chains': USED_CHAINS,
+        'portfolio/project_list': [
+            payloads.project(index=index, chain=chain) for chain in USED_CHAINS for index in range(10)
+        ],
+        'token/balance_list': payloads.tokens(count=100),
+        'token/cache_balance_list': payloads.tokens(count=100),
+        'user/addr': user,
+        'user/total_balance': {'total_usd_value': 1000.0},
+        'hi/user/info': {'id': user['id'], 'user': user}
+    }
+
+
+class StandInServer:
+    def __init__(
+            self, latency: float = 0.0, jitter: float = 0.0, payloads_dir: Optional[str] = None,
+            host: str = '127.0.0.1', port: int = 0
+    ):
+        """
+        Initialize a local server that stands in for the DeBank API and replays payloads of every public endpoint.
+
+        Args:
+            latency (float): how many seconds every response is delayed. (0.0)
+            jitter (float): a random addition to the delay in seconds. (0.0)
+            payloads_dir (Optional[str]): a directory with recorded responses named after endpoints, e.g.
+                "token_balance_list.json", synthetic payloads are used for the missing ones. (None)
+            host (str): a host to listen on. (127.0.0.1)
+            port (int): a port to listen on, 0 means a free one. (0)
+
+        """
+        self.latency: float = latency
+        self.jitter: float = jitter
+        self.host: str = host
+        self.port: int = port
+        self.requests: int = 0
+        self.bodies: Dict[str, bytes] = {}
+        self.history: dict = {}
+        self._runner: Optional[web.AppRunner] = None
+
+        for endpoint, data in synthetic_payloads().items():
+            response = {'error_code': 0, 'data': data}
+            if payloads_dir:
+                path = os.path.join(payloads_dir, endpoint.replace('/', '_') + '.json')
+                if os.path.exists(path):
+                    with open(path, encoding='utf-8') as file:
+                        response = json.load(file)
+
+            if endpoint == 'history/list':
+                self.history = response['data']
+
+            self.bodies[endpoint] = json.dumps(response).encode()
+
+    @property
+    def base_url(self) -> str:
+        return f'http://{self.host}:{self.port}/'
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_get('/history/list', self._history_list)
+        app.router.add_get('/{endpoint:.+}', self._replay)
+        app.router.add_route('HEAD', '/', self._head)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> 'StandInServer':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.stop()
+
+    async def _delay(self) -> None:
+        self.requests += 1
+        delay = self.latency + random.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+
+    async def _head(self, request: web.Request) -> web.Response:
+        return web.Response()
+
+    async def _replay(self, request: web.Request) -> web.Response:
+        await self._delay()
+        body = self.bodies.get(request.match_info['endpoint'])
+        if body is None:
+            return web.Response(status=404)
+
+        return web.Response(body=body, content_type='application/json')
+
+    async def _history_list(self, request: web.Request) -> web.Response:
+        await self._delay()
+        start_time = float(request.query.get('start_time') or 0) or float('inf')
+        page_count = int(request.query.get('page_count') or 20)
+        history_list = [tx for tx in self.history['history_list'] if tx['time_at'] < start_time][:page_count]
+        return web.json_response(
+            {'error_code': 0, 'data': {**self.history, 'history_list': history_list}}, dumps=json.dumps
+        )
+
+
+async def serve(latency: float, jitter: float, payloads_dir: Optional[str], port: int) -> None:
+    async with StandInServer(latency=latency, jitter=jitter, payloads_dir=payloads_dir, port=port) as server:
+        print(f'Serving on {server.base_url}')
+        await asyncio.Event().wait()
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--latency', type=float, default=0.05, help='response delay in seconds')
+    parser.add_argument('--jitter', type=float, default=0.0, help='random addition to the delay in seconds')
+    parser.add_argument('--payloads', default=None, help='a directory with recorded responses')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='A local stand-in for the DeBank API.')
+    add_arguments(parser)
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+    asyncio.run(serve(latency=args.latency, jitter=args.jitter, payloads_dir=args.payloads, port=args.port))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+import argparse
+import asyncio
+import multiprocessing
+import socket
+import statistics
+import time
+from typing import Callable, Awaitable, List, Optional
+
+from py_debank_async import batch, custom, history, nft
+from py_debank_async.client import DebankClient
+from py_debank_async.utils import gather_limited
+from benchmarks.server import add_arguments, serve
+
+ADDRESS = '0x' + '2' * 40
+
+
+def percentile(values: List[float], share: float) -> float:
+    values = sorted(values)
+    return values[min(int(len(values) * share), len(values) - 1)]
+
+
+def timed(call: Callable[..., Awaitable], latencies: List[float]) -> Callable[..., Awaitable]:
+    async def wrapper(**kwargs):
+        started_at = time.perf_counter()
+        result = await call(**kwargs)
+        latencies.append(time.perf_counter() - started_at)
+        return result
+
+    return wrapper
+
+
+async def run_calls(
+        call: Callable[..., Awaitable], client: DebankClient, calls: int, concurrency: int, latencies: List[float]
+) -> None:
+    call = timed(call=call, latencies=latencies)
+    await gather_limited((call(address=ADDRESS, client=client) for _ in range(calls)), limit=concurrency)
+
+
+async def run_scan(client: DebankClient, calls: int, concurrency: int, latencies: List[float]) -> None:
+    async for _ in batch.scan(
+            addresses=[f'0x{index:040x}' for index in range(calls)],
+            operation=timed(call=custom.get_balance, latencies=latencies), concurrency=concurrency, client=client
+    ):
+        pass
+
+
+OPERATIONS = {
+    'custom.get_balance': lambda **kwargs: run_calls(call=custom.get_balance, **kwargs),
+    'history.list_': lambda **kwargs: run_calls(
+        call=lambda address, client: history.list_(address=address, page_count=100, client=client), **kwargs
+    ),
+    'nft.collection_list': lambda **kwargs: run_calls(call=nft.collection_list, **kwargs),
+    'batch.scan': run_scan
+}
+
+
+async def measure(name: str, calls: int, concurrency: int, base_url: str) -> None:
+    """
+    Make calls of an operation with a certain concurrency and print its throughput, latency and CPU usage.
+    The CPU time is measured in this process only, the stand-in server runs in another one.
+
+    Args:
+        name (str): a name of the operation.
+        calls (int): how many calls to make, for a batch scan it's the number of addresses.
+        concurrency (int): how many calls are made at the same time.
+        base_url (str): a URL of the stand-in server.
+
+    """
+    latencies = []
+    async with DebankClient(base_url=base_url, coalesce=False) as client:
+        await OPERATIONS[name](client=client, calls=1, concurrency=1, latencies=[])
+        client.requests = 0
+        cpu_started_at = time.process_time()
+        started_at = time.perf_counter()
+        await OPERATIONS[name](client=client, calls=calls, concurrency=concurrency, latencies=latencies)
+        elapsed = time.perf_counter() - started_at
+        cpu = time.process_time() - cpu_started_at
+        requests = client.requests
+
+    print(
+        f'{name:<22} {concurrency:>5} {calls / elapsed:>9.1f} {requests / elapsed:>10.1f} '
+        f'{statistics.median(latencies) * 1000:>9.1f} {percentile(latencies, 0.99) * 1000:>9.1f} '
+        f'{cpu / calls * 1000:>12.2f}'
+    )
+
+
+def run_server(latency: float, jitter: float, payloads_dir: Optional[str], port: int) -> None:
+    asyncio.run(serve(latency=latency, jitter=jitter, payloads_dir=payloads_dir, port=port))
+
+
+def wait_for_port(port: int, timeout: float = 30.0) -> None:
+    finish_at = time.monotonic() + timeout
+    while True:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=1):
+                return
+
+        except OSError:
+            if time.monotonic() > finish_at:
+                raise
+
+            time.sleep(0.1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark the library against a local stand-in DeBank API.')
+    add_arguments(parser)
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--calls', type=int, default=50, help='calls of every operation')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 10, 50], help='concurrency levels')
+    parser.add_argument('--operations', nargs='+', default=list(OPERATIONS), choices=list(OPERATIONS))
+    args = parser.parse_args()
+
+    server = multiprocessing.Process(
+        target=run_server, args=(args.latency, args.jitter, args.payloads, args.port), daemon=True
+    )
+    server.start()
+    try:
+        wait_for_port(port=args.port)
+        print(f'Latency: {args.latency * 1000:.0f} ms, calls: {args.calls}')
+        print(
+            f'{"Operation":<22} {"Conc.":>5} {"Calls/s":>9} {"Requests/s":>10} {"p50, ms":>9} {"p99, ms":>9} '
+            f'{"CPU/call, ms":>12}'
+        )
+        for name in args.operations:
+            for concurrency in args.concurrency:
+                asyncio.run(measure(
+                    name=name, calls=args.calls, concurrency=concurrency, base_url=f'http://127.0.0.1:{args.port}/'
+                ))
+
+    finally:
+        server.terminate()
+        server.join()
+
+
+if __name__ == '__main__':
+    main()
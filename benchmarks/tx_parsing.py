@@ -0,0 +1,28 @@
+import copy
+import time
+
+from py_debank_async import compact, models
+from benchmarks import payloads
+
+
+def measure(name: str, history_class: type, page: dict, repeat: int = 5) -> None:
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        history_class(address='0x' + '2' * 40, data=page)
+
+    elapsed = time.perf_counter() - started_at
+    print(f'{name:<24} {len(page["history_list"]) * repeat / elapsed:>12.0f} txs/s')
+
+
+def main() -> None:
+    for count, distinct_tokens in ((20, 30), (2_000, 500), (20_000, 2_000)):
+        page = payloads.history_page(count=count, distinct_tokens=distinct_tokens)
+        original = copy.deepcopy(page)
+        print(f'{count} transactions, {distinct_tokens} tokens')
+        measure('models.History', models.History, page)
+        measure('compact.History', compact.History, page)
+        print(f'{"page data unchanged":<24} {page == original!s:>12}\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,13 @@
 from typing import Optional, List
 
+from py_debank_async.client import DebankClient
 from py_debank_async.models import Entrypoints, Curve
 from py_debank_async.utils import get_proxy, async_get, check_response, get_headers
 
 
-async def net_curve_24h(address: str, proxies: Optional[str or List[str]] = None) -> Curve:
+async def net_curve_24h(
+        address: str, proxies: Optional[str or List[str]] = None, client: Optional[DebankClient] = None
+) -> Curve:
     """
     Get an address's asset value history for the last 24 hours.
 
@@ -12,6 +15,7 @@ async def net_curve_24h(address: str, proxies: Optional[str or List[str]] = None
         address (str): an address.
         proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
             a request. (None)
+        client (Optional[DebankClient]): a client with a persistent connection pool for making a request. (None)
 
     Returns:
         Curve: the address's asset value history for the last 24 hours.
@@ -22,7 +26,7 @@ async def net_curve_24h(address: str, proxies: Optional[str or List[str]] = None
     }
     status_code, json_response = await async_get(
         url=Entrypoints.PUBLIC.ASSET + 'net_curve_24h', params=params, headers=await get_headers(),
-        proxy=await get_proxy(proxy=proxies)
+        proxy=await get_proxy(proxy=proxies), client=client
     )
     await check_response(status_code=status_code, json_response=json_response)
     return Curve(data=json_response['data'])
@@ -0,0 +1,309 @@
+import asyncio
+import multiprocessing
+import os
+import pickle
+import queue
+import time
+import traceback
+from typing import Optional, Iterable, Iterator, Callable, Awaitable, AsyncIterator, Dict, Any, List
+
+from pretty_utils.type_functions.classes import AutoRepr
+
+from py_debank_async.client import DebankClient
+
+
+class ScanResult(AutoRepr):
+    def __init__(self, address: str, result: Any = None, error: Optional[Exception] = None):
+        self.address: str = address
+        self.result: Any = result
+        self.error: Optional[Exception] = error
+
+
+class ScanStats(AutoRepr):
+    def __init__(self):
+        self.addresses: int = 0
+        self.errors: int = 0
+        self.requests: int = 0
+        self.elapsed: float = 0.0
+        self.addresses_per_second: float = 0.0
+        self.requests_per_second: float = 0.0
+
+    def update(self, result: ScanResult, requests: int, elapsed: float) -> None:
+        self.addresses += 1
+        if result.error:
+            self.errors += 1
+
+        self.requests = requests
+        self.elapsed = elapsed
+        if self.elapsed:
+            self.addresses_per_second = self.addresses / self.elapsed
+            self.requests_per_second = self.requests / self.elapsed
+
+
+def unique_addresses(addresses: Iterable[str]) -> Iterator[str]:
+    """
+    Lowercase addresses and skip the repeated ones.
+
+    Args:
+        addresses (Iterable[str]): addresses.
+
+    Returns:
+        Iterator[str]: the unique lowercased addresses in the original order.
+
+    """
+    seen = set()
+    for address in addresses:
+        address = address.strip().lower()
+        if address and address not in seen:
+            seen.add(address)
+            yield address
+
+
+async def scan(
+        addresses: Iterable[str], operation: Callable[..., Awaitable], concurrency: int = 10,
+        endpoint_limits: Optional[Dict[str, int]] = None, client: Optional[DebankClient] = None,
+        on_progress: Optional[Callable[[ScanStats], Any]] = None, **kwargs
+) -> AsyncIterator[ScanResult]:
+    """
+    Apply an operation to many addresses concurrently and yield results as soon as they are ready.
+
+    Args:
+        addresses (Iterable[str]): addresses, they are lowercased and deduplicated.
+        operation (Callable[..., Awaitable]): a function taking an address and a client, e.g. custom.get_balance
+            or user.total_balance.
+        concurrency (int): how many addresses can be processed at the same time. (10)
+        endpoint_limits (Optional[Dict[str, int]]): the maximum number of simultaneous requests to an endpoint
+            (e.g. 'nft/collection_list') or an endpoint group (e.g. 'nft'), they're applied to the client created
+            by the scan only, a specified client keeps its own limits. (None)
+        client (Optional[DebankClient]): a client with a persistent connection pool for making a request, it's
+            created and closed by the scan if it isn't specified. (None)
+        on_progress (Optional[Callable[[ScanStats], Any]]): a function that is called with the scan statistics
+            after every processed address. (None)
+        **kwargs: other arguments for the operation, e.g. proxies.
+
+    Returns:
+        AsyncIterator[ScanResult]: results in the order of completion, an exception of the operation is put to
+            the "error" attribute instead of aborting the scan.
+
+    """
+    own_client = client is None
+    if own_client:
+        client = DebankClient(endpoint_limits=endpoint_limits)
+
+    addresses = unique_addresses(addresses)
+    queue = asyncio.Queue(maxsize=concurrency * 2)
+    stats = ScanStats()
+    started_at = time.monotonic()
+    requests_before = client.requests
+    failures = []
+
+    async def worker() -> None:
+        try:
+            for address in addresses:
+                try:
+                    result = ScanResult(
+                        address=address, result=await operation(address=address, client=client, **kwargs)
+                    )
+
+                except Exception as e:
+                    result = ScanResult(address=address, error=e)
+
+                await queue.put(result)
+
+        except Exception as e:
+            failures.append(e)
+
+        await queue.put(None)
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    try:
+        running = len(workers)
+        while running:
+            result = await queue.get()
+            if result is None:
+                running -= 1
+                continue
+
+            stats.update(
+                result=result, requests=client.requests - requests_before, elapsed=time.monotonic() - started_at
+            )
+            if on_progress:
+                on_progress(stats)
+
+            yield result
+
+        if failures:
+            raise failures[0]
+
+    finally:
+        for task in workers:
+            task.cancel()
+
+        if own_client:
+            await client.close()
+
+
+async def scan_processes(
+        addresses: Iterable[str], operation: Callable[..., Awaitable], processes: Optional[int] = None,
+        concurrency: int = 10, endpoint_limits: Optional[Dict[str, int]] = None,
+        client_kwargs: Optional[Dict[str, Any]] = None, transform: Optional[Callable[[Any], Any]] = None,
+        batch_size: int = 50, on_progress: Optional[Callable[[ScanStats], Any]] = None, **kwargs
+) -> AsyncIterator[ScanResult]:
+    """
+    Apply an operation to many addresses in several processes, so decoding and model building use all CPU cores.
+    The addresses are split into shards, every process scans its shard with its own event loop and client, and
+    results are sent back in pickled batches. The calling script must be guarded by if __name__ == '__main__'.
+
+    Args:
+        addresses (Iterable[str]): addresses, they are lowercased and deduplicated.
+        operation (Callable[..., Awaitable]): a module-level function taking an address and a client, e.g.
+            custom.get_balance.
+        processes (Optional[int]): how many processes to start. (the number of CPU cores)
+        concurrency (int): how many addresses a process can handle at the same time. (10)
+        endpoint_limits (Optional[Dict[str, int]]): the maximum number of simultaneous requests of a process to
+            an endpoint (e.g. 'nft/collection_list') or an endpoint group (e.g. 'nft'). (None)
+        client_kwargs (Optional[Dict[str, Any]]): picklable arguments of a DebankClient of every process. (None)
+        transform (Optional[Callable[[Any], Any]]): a module-level function applied to results in the processes
+            to make them smaller before sending, e.g. to get a total balance from chains. (None)
+        batch_size (int): how many results a process sends at a time. (50)
+        on_progress (Optional[Callable[[ScanStats], Any]]): a function that is called with the scan statistics
+            after every processed address. (None)
+        **kwargs: other arguments for the operation, they must be picklable.
+
+    Returns:
+        AsyncIterator[ScanResult]: results in the order of completion, an exception of the operation is put to
+            the "error" attribute instead of aborting the scan.
+
+    """
+    addresses = list(unique_addresses(addresses))
+    processes = min(processes or os.cpu_count() or 1, len(addresses))
+    if not processes:
+        return
+
+    context = multiprocessing.get_context('spawn')
+    results_queue = context.Queue()
+    workers = [
+        context.Process(
+            target=_scan_shard, daemon=True, args=(
+                addresses[index::processes], operation, concurrency, endpoint_limits, client_kwargs or {},
+                transform, batch_size, kwargs, results_queue
+            )
+        ) for index in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+
+    loop = asyncio.get_running_loop()
+    stats = ScanStats()
+    started_at = time.monotonic()
+    requests = 0
+    try:
+        running = len(workers)
+        while running:
+            message = await loop.run_in_executor(None, _receive, results_queue)
+            if message is None:
+                if not any(worker.is_alive() for worker in workers) and results_queue.empty():
+                    raise RuntimeError('Scanning processes exited unexpectedly')
+
+                continue
+
+            kind, payload, worker_requests = message
+            requests += worker_requests
+            if kind == 'done':
+                running -= 1
+                continue
+
+            if kind == 'failed':
+                raise RuntimeError(f'A scanning process failed:\n{payload}')
+
+            for result in pickle.loads(payload):
+                stats.update(result=result, requests=requests, elapsed=time.monotonic() - started_at)
+                if on_progress:
+                    on_progress(stats)
+
+                yield result
+
+    finally:
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+
+            worker.join()
+
+
+def _receive(results_queue: multiprocessing.Queue) -> Optional[tuple]:
+    try:
+        return results_queue.get(timeout=0.5)
+
+    except queue.Empty:
+        return
+
+
+def _scan_shard(
+        addresses: List[str], operation: Callable[..., Awaitable], concurrency: int,
+        endpoint_limits: Optional[Dict[str, int]], client_kwargs: Dict[str, Any],
+        transform: Optional[Callable[[Any], Any]], batch_size: int, kwargs: Dict[str, Any],
+        results_queue: multiprocessing.Queue
+) -> None:
+    try:
+        asyncio.run(_scan_shard_async(
+            addresses=addresses, operation=operation, concurrency=concurrency, endpoint_limits=endpoint_limits,
+            client_kwargs=client_kwargs, transform=transform, batch_size=batch_size, kwargs=kwargs,
+            results_queue=results_queue
+        ))
+
+    except BaseException:
+        results_queue.put(('failed', traceback.format_exc(), 0))
+
+
+async def _scan_shard_async(
+        addresses: List[str], operation: Callable[..., Awaitable], concurrency: int,
+        endpoint_limits: Optional[Dict[str, int]], client_kwargs: Dict[str, Any],
+        transform: Optional[Callable[[Any], Any]], batch_size: int, kwargs: Dict[str, Any],
+        results_queue: multiprocessing.Queue
+) -> None:
+    batch = []
+    sent_requests = 0
+    async with DebankClient(**client_kwargs) as client:
+        client.limit_endpoints(limits=endpoint_limits or {})
+        async for result in scan(
+                addresses=addresses, operation=operation, concurrency=concurrency, client=client, **kwargs
+        ):
+            if transform and not result.error:
+                try:
+                    result.result = transform(result.result)
+
+                except Exception as e:
+                    result = ScanResult(address=result.address, error=e)
+
+            batch.append(result)
+            if len(batch) >= batch_size:
+                results_queue.put(('results', _dump(batch), client.requests - sent_requests))
+                sent_requests = client.requests
+                batch = []
+
+        if batch:
+            results_queue.put(('results', _dump(batch), client.requests - sent_requests))
+            sent_requests = client.requests
+
+        results_queue.put(('done', None, client.requests - sent_requests))
+
+
+def _dump(batch: List[ScanResult]) -> bytes:
+    try:
+        return pickle.dumps(batch, pickle.HIGHEST_PROTOCOL)
+
+    except Exception:
+        return pickle.dumps([_picklable(result) for result in batch], pickle.HIGHEST_PROTOCOL)
+
+
+def _picklable(result: ScanResult) -> ScanResult:
+    try:
+        pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+        return result
+
+    except Exception:
+        if result.error:
+            return ScanResult(address=result.address, error=RuntimeError(repr(result.error)))
+
+        raise
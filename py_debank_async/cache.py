@@ -0,0 +1,356 @@
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, Dict, Tuple, Iterator
+from urllib.parse import urlencode
+
+from pretty_utils.type_functions.classes import AutoRepr
+
+from py_debank_async import decoder
+
+_bypass: ContextVar[bool] = ContextVar('bypass', default=False)
+
+
+class CacheStats(AutoRepr):
+    def __init__(self):
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.entries: int = 0
+        self.size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0.0
+
+
+class ResponseCache:
+    def __init__(
+            self, ttl: float = 60.0, ttls: Optional[Dict[str, float]] = None, max_entries: int = 10_000,
+            max_bytes: Optional[int] = None
+    ):
+        """
+        Initialize an in-memory cache of successful responses with a lifetime and LRU eviction.
+
+        Args:
+            ttl (float): how many seconds a response is kept. (60.0)
+            ttls (Optional[Dict[str, float]]): lifetimes for endpoints (e.g. 'user/addr') or endpoint groups
+                (e.g. 'nft') that override the common one, 0 disables caching. (None)
+            max_entries (int): the maximum number of kept responses. (10000)
+            max_bytes (Optional[int]): the maximum total size of kept responses. (no limit)
+
+        """
+        self.ttl: float = ttl
+        self.ttls: Dict[str, float] = ttls or {}
+        self.max_entries: int = max_entries
+        self.max_bytes: Optional[int] = max_bytes
+        self.stats: CacheStats = CacheStats()
+        self._entries: OrderedDict[str, Tuple[float, str]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(endpoint: str, params: dict) -> str:
+        return f'{endpoint}?{urlencode(sorted(params.items()))}'
+
+    def ttl_for(self, endpoint: str) -> float:
+        """
+        Get a lifetime of responses of an endpoint.
+
+        Args:
+            endpoint (str): the endpoint, e.g. 'nft/collection_list'.
+
+        Returns:
+            float: the lifetime in seconds.
+
+        """
+        if endpoint in self.ttls:
+            return self.ttls[endpoint]
+
+        return self.ttls.get(endpoint.split('/')[0], self.ttl)
+
+    def get(self, endpoint: str, params: dict) -> Optional[dict]:
+        """
+        Get a kept response.
+
+        Args:
+            endpoint (str): the endpoint, e.g. 'nft/collection_list'.
+            params (dict): params of the request.
+
+        Returns:
+            Optional[dict]: a new copy of the parsed JSON dictionary or None if there is no fresh response.
+
+        """
+        if _bypass.get() or not self.ttl_for(endpoint):
+            return
+
+        key = self.key(endpoint=endpoint, params=params)
+        entry = self._entries.get(key)
+        if entry and entry[0] <= time.monotonic():
+            self._remove(key)
+            entry = None
+
+        if not entry:
+            self.stats.misses += 1
+            return
+
+        self.stats.hits += 1
+        self._entries.move_to_end(key)
+        return decoder.loads(entry[1])
+
+    def set(self, endpoint: str, params: dict, json_response: dict) -> None:
+        """
+        Keep a response.
+
+        Args:
+            endpoint (str): the endpoint, e.g. 'nft/collection_list'.
+            params (dict): params of the request.
+            json_response (dict): the parsed JSON dictionary.
+
+        """
+        ttl = self.ttl_for(endpoint)
+        if not ttl:
+            return
+
+        key = self.key(endpoint=endpoint, params=params)
+        self._remove(key)
+        body = json.dumps(json_response, separators=(',', ':'))
+        self._entries[key] = (time.monotonic() + ttl, body)
+        self.stats.size += len(body)
+        self.stats.entries = len(self._entries)
+        while self._entries and (
+                len(self._entries) > self.max_entries or (self.max_bytes and self.stats.size > self.max_bytes)
+        ):
+            self._remove(next(iter(self._entries)))
+            self.stats.evictions += 1
+
+    def invalidate(self, endpoint: Optional[str] = None, params: Optional[dict] = None) -> None:
+        """
+        Forget kept responses.
+
+        Args:
+            endpoint (Optional[str]): the endpoint, e.g. 'nft/collection_list', or an endpoint group, e.g. 'nft'.
+                (all endpoints)
+            params (Optional[dict]): params of the request, if they aren't specified, all responses of
+                the endpoint are forgotten. (None)
+
+        """
+        if endpoint and params is not None:
+            self._remove(self.key(endpoint=endpoint, params=params))
+            return
+
+        for key in list(self._entries):
+            name = key.split('?')[0]
+            if not endpoint or name == endpoint or name.split('/')[0] == endpoint:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """
+        Forget all kept responses.
+        """
+        self.invalidate()
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry:
+            self.stats.size -= len(entry[1])
+            self.stats.entries = len(self._entries)
+
+
+class PersistentCache:
+    def __init__(
+            self, path: str = 'debank_cache.sqlite3', max_bytes: Optional[int] = None, settle_time: float = 3600.0
+    ):
+        """
+        Initialize an SQLite cache that keeps responses that never change forever, i.e. prices at a point in
+        time and transaction history pages older than the settle time. It survives restarts and can be shared
+        between processes. Hits only read the database, their access times are written with the next kept
+        response, compaction or closing.
+
+        Args:
+            path (str): a path to the database file. (debank_cache.sqlite3)
+            max_bytes (Optional[int]): the total size of kept responses that compaction shrinks the cache to,
+                the least recently used ones are removed first. (no limit)
+            settle_time (float): how many seconds must pass after a point in time for the data before it
+                to be considered final. (3600.0)
+
+        """
+        self.path: str = path
+        self.max_bytes: Optional[int] = max_bytes
+        self.settle_time: float = settle_time
+        self.stats: CacheStats = CacheStats()
+        self._accessed: Dict[str, float] = {}
+        self._connection: sqlite3.Connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS responses '
+            '(key TEXT PRIMARY KEY, endpoint TEXT, body BLOB, size INTEGER, accessed_at REAL)'
+        )
+        self._connection.commit()
+
+    def is_immutable(self, endpoint: str, params: dict) -> bool:
+        """
+        Check if a response of a request never changes.
+
+        Args:
+            endpoint (str): the endpoint, e.g. 'history/list'.
+            params (dict): params of the request.
+
+        Returns:
+            bool: True if the response never changes.
+
+        """
+        if endpoint == 'history/token_price':
+            point = params.get('time_at')
+
+        elif endpoint == 'history/list':
+            point = params.get('start_time')
+
+        else:
+            return False
+
+        try:
+            point = float(point)
+
+        except (TypeError, ValueError):
+            return False
+
+        return 0 < point < time.time() - self.settle_time
+
+    def get(self, endpoint: str, params: dict) -> Optional[dict]:
+        """
+        Get a kept response.
+
+        Args:
+            endpoint (str): the endpoint, e.g. 'history/list'.
+            params (dict): params of the request.
+
+        Returns:
+            Optional[dict]: the parsed JSON dictionary or None if it isn't kept.
+
+        """
+        if _bypass.get() or not self.is_immutable(endpoint=endpoint, params=params):
+            return
+
+        key = ResponseCache.key(endpoint=endpoint, params=params)
+        row = self._connection.execute('SELECT body FROM responses WHERE key = ?', (key,)).fetchone()
+        if not row:
+            self.stats.misses += 1
+            return
+
+        self.stats.hits += 1
+        self._accessed[key] = time.time()
+        return decoder.loads(row[0])
+
+    def set(self, endpoint: str, params: dict, json_response: dict) -> None:
+        """
+        Keep a response if it never changes.
+
+        Args:
+            endpoint (str): the endpoint, e.g. 'history/list'.
+            params (dict): params of the request.
+            json_response (dict): the parsed JSON dictionary.
+
+        """
+        if not self.is_immutable(endpoint=endpoint, params=params):
+            return
+
+        body = json.dumps(json_response, separators=(',', ':')).encode()
+        self._write_accessed()
+        self._connection.execute(
+            'INSERT OR REPLACE INTO responses (key, endpoint, body, size, accessed_at) VALUES (?, ?, ?, ?, ?)',
+            (ResponseCache.key(endpoint=endpoint, params=params), endpoint, body, len(body), time.time())
+        )
+        self._connection.commit()
+
+    def size(self) -> int:
+        """
+        Get the total size of kept responses.
+
+        Returns:
+            int: the size in bytes.
+
+        """
+        return self._connection.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+    def count(self) -> int:
+        """
+        Get the number of kept responses.
+
+        Returns:
+            int: the number of responses.
+
+        """
+        return self._connection.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def compact(self) -> None:
+        """
+        Remove the least recently used responses exceeding the maximum size and shrink the database file.
+        """
+        self._write_accessed()
+        self._connection.commit()
+        if self.max_bytes is not None:
+            excess = self.size() - self.max_bytes
+            keys = []
+            for key, size in self._connection.execute('SELECT key, size FROM responses ORDER BY accessed_at'):
+                if excess <= 0:
+                    break
+
+                keys.append((key,))
+                excess -= size
+
+            self._connection.executemany('DELETE FROM responses WHERE key = ?', keys)
+            self._connection.commit()
+            self.stats.evictions += len(keys)
+
+        self._connection.execute('VACUUM')
+
+    def invalidate(self, endpoint: Optional[str] = None) -> None:
+        """
+        Forget kept responses.
+
+        Args:
+            endpoint (Optional[str]): the endpoint, e.g. 'history/list'. (all endpoints)
+
+        """
+        if endpoint:
+            self._connection.execute('DELETE FROM responses WHERE endpoint = ?', (endpoint,))
+
+        else:
+            self._connection.execute('DELETE FROM responses')
+
+        self._connection.commit()
+
+    def close(self) -> None:
+        """
+        Close the database.
+        """
+        self._write_accessed()
+        self._connection.commit()
+        self._connection.close()
+
+    def _write_accessed(self) -> None:
+        if self._accessed:
+            self._connection.executemany(
+                'UPDATE responses SET accessed_at = ? WHERE key = ?',
+                [(accessed_at, key) for key, accessed_at in self._accessed.items()]
+            )
+            self._accessed.clear()
+
+
+@contextmanager
+def bypass() -> Iterator[None]:
+    """
+    Don't take responses from caches inside the block, fresh responses are still put to them.
+    """
+    token = _bypass.set(True)
+    try:
+        yield
+
+    finally:
+        _bypass.reset(token)
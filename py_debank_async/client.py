@@ -0,0 +1,446 @@
+import asyncio
+import copy
+import functools
+import time
+from concurrent.futures import Executor
+from typing import Optional, Tuple, Dict, Any, Callable, List
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from py_debank_async import decoder
+from py_debank_async.cache import ResponseCache, PersistentCache
+from py_debank_async.instrumentation import Metrics, RequestInfo, current_usage
+from py_debank_async.models import Entrypoints
+from py_debank_async.proxy import ProxyPool
+from py_debank_async.retry import RetryPolicy, RetryBudget, parse_retry_after
+from py_debank_async.transport import Transport, AiohttpTransport
+
+CONNECTION_ERRORS = (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError)
+
+
+class DebankClient:
+    def __init__(
+            self, limit: int = 100, limit_per_host: int = 0, keepalive_timeout: float = 60.0,
+            ttl_dns_cache: Optional[int] = 300, timeout: Optional[float] = 30.0,
+            endpoint_limits: Optional[Dict[str, int]] = None, proxy_pool: Optional[ProxyPool] = None,
+            retry_policy: Optional[RetryPolicy] = None, retry_policies: Optional[Dict[str, RetryPolicy]] = None,
+            retry_budget: Optional[RetryBudget] = None, cache: Optional[ResponseCache] = None,
+            persistent_cache: Optional[PersistentCache] = None, coalesce: bool = True,
+            json_loads: Optional[Callable[[bytes], Any]] = None, base_url: Optional[str] = None,
+            transport: Optional[Transport] = None, metrics: Optional[Metrics] = None,
+            on_request_start: Optional[List[Callable[[RequestInfo], Any]]] = None,
+            on_request_end: Optional[List[Callable[[RequestInfo], Any]]] = None,
+            executor: Optional[Executor] = None, offload_size: int = 262_144, offload_items: int = 500
+    ):
+        """
+        Initialize a client that keeps a pool of alive connections to the DeBank API between requests.
+
+        Args:
+            limit (int): the maximum number of simultaneously opened connections, 0 means no limit. (100)
+            limit_per_host (int): the maximum number of simultaneously opened connections to the same host,
+                0 means no limit. (0)
+            keepalive_timeout (float): how many seconds an idle connection is kept alive. (60.0)
+            ttl_dns_cache (Optional[int]): how many seconds resolved DNS entries are cached, None means forever. (300)
+            timeout (Optional[float]): a total timeout of a request in seconds, None means no timeout. (30.0)
+            endpoint_limits (Optional[Dict[str, int]]): the maximum number of simultaneous requests to an endpoint
+                (e.g. 'nft/collection_list') or an endpoint group (e.g. 'nft'). (None)
+            proxy_pool (Optional[ProxyPool]): a pool to take a proxy from when a request is made without a proxy,
+                it can be shared between clients. (None)
+            retry_policy (Optional[RetryPolicy]): a policy for retrying 429, 5xx and connection errors of all
+                endpoints, a proxy from the proxy pool is changed between attempts. (no retries)
+            retry_policies (Optional[Dict[str, RetryPolicy]]): policies for endpoints (e.g. 'nft/collection_list')
+                or endpoint groups (e.g. 'nft') that override the common one. (None)
+            retry_budget (Optional[RetryBudget]): a budget that limits the total number of retries. (no limit)
+            cache (Optional[ResponseCache]): a cache of successful responses, use cache.bypass() to skip it for
+                some calls. (no caching)
+            persistent_cache (Optional[PersistentCache]): an on-disk cache of responses that never change, e.g.
+                historical prices and old transaction history pages. (no caching)
+            coalesce (bool): whether identical requests made at the same time share one network call. (True)
+            json_loads (Optional[Callable[[bytes], Any]]): a function parsing raw response bodies, e.g. orjson.loads,
+                which is faster but turns integers that exceed 64 bits, such as some "raw_amount" values, into
+                floats. (the standard library)
+            base_url (Optional[str]): a URL that replaces the public API entrypoint in requests, e.g. of a local
+                stand-in server for benchmarks. (None)
+            transport (Optional[Transport]): a way of making requests, e.g. a RecordingTransport or
+                a ReplayTransport, the connection pool parameters are ignored if it's specified. (AiohttpTransport)
+            metrics (Optional[Metrics]): counters and latency histograms to collect, they can be shared between
+                clients. (None)
+            on_request_start (Optional[List[Callable[[RequestInfo], Any]]]): functions called before every
+                network attempt. (None)
+            on_request_end (Optional[List[Callable[[RequestInfo], Any]]]): functions called after every network
+                attempt with its duration, status code, response size, proxy and error. (None)
+            executor (Optional[Executor]): a thread or process pool that decodes large responses and builds models
+                of them off the event loop, so concurrent small requests aren't delayed. A process pool requires
+                a picklable json_loads. (None)
+            offload_size (int): the minimum size of a response body in bytes that is decoded in the executor.
+                (262144)
+            offload_items (int): the minimum number of items (tokens, projects, transactions) of a response whose
+                models are built in the executor. (500)
+
+        """
+        self.transport: Transport = transport
+        if self.transport is None:
+            self.transport = AiohttpTransport(
+                limit=limit, limit_per_host=limit_per_host, keepalive_timeout=keepalive_timeout,
+                ttl_dns_cache=ttl_dns_cache, timeout=timeout
+            )
+
+        self.requests: int = 0
+        self.endpoint_limits: Dict[str, int] = {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.proxy_pool: Optional[ProxyPool] = proxy_pool
+        self.retry_policy: Optional[RetryPolicy] = retry_policy
+        self.retry_policies: Dict[str, RetryPolicy] = retry_policies or {}
+        self.retry_budget: Optional[RetryBudget] = retry_budget
+        self.cache: Optional[ResponseCache] = cache
+        self.persistent_cache: Optional[PersistentCache] = persistent_cache
+        self.coalesce: bool = coalesce
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._waiters: Dict[str, int] = {}
+        self.json_loads: Callable[[bytes], Any] = json_loads or decoder.loads
+        self.base_url: Optional[str] = base_url
+        self.metrics: Optional[Metrics] = metrics
+        self.on_request_start: List[Callable[[RequestInfo], Any]] = list(on_request_start or [])
+        self.on_request_end: List[Callable[[RequestInfo], Any]] = list(on_request_end or [])
+        self.executor: Optional[Executor] = executor
+        self.offload_size: int = offload_size
+        self.offload_items: int = offload_items
+        self.limit_endpoints(limits=endpoint_limits or {})
+
+    async def __aenter__(self) -> 'DebankClient':
+        return await self.open()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    @property
+    def closed(self) -> bool:
+        return self.transport.closed
+
+    async def open(self) -> 'DebankClient':
+        """
+        Open the connection pool if it isn't opened yet.
+
+        Returns:
+            DebankClient: the client itself.
+
+        """
+        await self.transport.open()
+        return self
+
+    async def close(self) -> None:
+        """
+        Close the connection pool.
+        """
+        await self.transport.close()
+
+    async def warm_up(
+            self, connections: int = 1, url: str = Entrypoints.PUBLIC.ENTRYPOINT, proxy: Optional[str] = None
+    ) -> None:
+        """
+        Open connections in advance so that the first requests don't pay for DNS lookups and handshakes.
+
+        Args:
+            connections (int): how many connections to open. (1)
+            url (str): a URL of the host to connect to. (the DeBank API)
+            proxy (Optional[str]): an HTTP proxy in the format: http://user:password@ip:port (None)
+
+        """
+        await self.transport.warm_up(url=self.resolve(url), connections=connections, proxy=proxy)
+
+    def limit_endpoints(self, limits: Dict[str, int]) -> None:
+        """
+        Set the maximum number of simultaneous requests to endpoints or endpoint groups.
+
+        Args:
+            limits (Dict[str, int]): limits by endpoints (e.g. 'nft/collection_list') or endpoint groups (e.g. 'nft').
+
+        """
+        for name, limit in limits.items():
+            self.endpoint_limits[name] = limit
+            self._semaphores[name] = asyncio.Semaphore(limit)
+
+    def resolve(self, url: str) -> str:
+        """
+        Get a URL a request is actually sent to.
+
+        Args:
+            url (str): a URL of the public API.
+
+        Returns:
+            str: the URL with the entrypoint replaced by the base URL if it's specified.
+
+        """
+        if self.base_url and url.startswith(Entrypoints.PUBLIC.ENTRYPOINT):
+            return self.base_url + url[len(Entrypoints.PUBLIC.ENTRYPOINT):]
+
+        return url
+
+    async def build(self, function: Callable[..., Any], items: int, **kwargs) -> Any:
+        """
+        Build models of a response, in the executor if the response is large enough.
+
+        Args:
+            function (Callable[..., Any]): a model class or a function building models, it and the arguments must
+                be picklable for a process pool.
+            items (int): the number of items of the response.
+            **kwargs: arguments of the function.
+
+        Returns:
+            Any: the result of the function.
+
+        """
+        if self.executor is None or items < self.offload_items:
+            return function(**kwargs)
+
+        return await asyncio.get_running_loop().run_in_executor(self.executor, functools.partial(function, **kwargs))
+
+    async def get(self, url: str, params: dict, headers: dict, proxy: Optional[str] = None) -> Tuple[int, dict]:
+        """
+        Make asynchronous GET request using the connection pool, retrying it according to the retry policy.
+        Identical requests made at the same time share one network call, each caller gets its own copy of
+        the response.
+
+        Args:
+            url (str): a URL.
+            params (dict): params for the request.
+            headers (dict): headers for the request.
+            proxy (Optional[str]): an HTTP proxy in the format: http://user:password@ip:port (a proxy from
+                the proxy pool)
+
+        Returns:
+            Tuple[int, dict]: a status code of the request and a parsed JSON dictionary.
+
+        """
+        endpoint = endpoint_name(url)
+        url = self.resolve(url)
+        if self.cache is not None:
+            json_response = self.cache.get(endpoint=endpoint, params=params)
+            if json_response is not None:
+                self._cache_hit(endpoint=endpoint)
+                return 200, json_response
+
+        if self.persistent_cache is not None:
+            json_response = self.persistent_cache.get(endpoint=endpoint, params=params)
+            if json_response is not None:
+                self._cache_hit(endpoint=endpoint)
+                return 200, json_response
+
+        if not self.coalesce:
+            return await self._stored_get(url=url, endpoint=endpoint, params=params, headers=headers, proxy=proxy)
+
+        key = ResponseCache.key(endpoint=url, params=params)
+        while key in self._in_flight:
+            future = self._in_flight[key]
+            self._waiters[key] = self._waiters.get(key, 0) + 1
+            try:
+                status, json_response = await asyncio.shield(future)
+                return status, copy.deepcopy(json_response)
+
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            result = await self._stored_get(url=url, endpoint=endpoint, params=params, headers=headers, proxy=proxy)
+            if self._waiters.get(key):
+                status, json_response = result
+                future.set_result((status, copy.deepcopy(json_response)))
+
+            else:
+                future.set_result(result)
+
+            return result
+
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+
+        finally:
+            del self._in_flight[key]
+            self._waiters.pop(key, None)
+
+    async def _stored_get(
+            self, url: str, endpoint: str, params: dict, headers: dict, proxy: Optional[str] = None
+    ) -> Tuple[int, dict]:
+        status, json_response = await self._retried_get(
+            url=url, endpoint=endpoint, params=params, headers=headers, proxy=proxy
+        )
+        if status == 200 and not json_response.get('error_code') and not pending_job(json_response):
+            if self.cache is not None:
+                self.cache.set(endpoint=endpoint, params=params, json_response=json_response)
+
+            if self.persistent_cache is not None:
+                self.persistent_cache.set(endpoint=endpoint, params=params, json_response=json_response)
+
+        return status, json_response
+
+    async def _retried_get(
+            self, url: str, endpoint: str, params: dict, headers: dict, proxy: Optional[str] = None
+    ) -> Tuple[int, dict]:
+        semaphore = by_endpoint(self._semaphores, endpoint=endpoint)
+        policy = by_endpoint(self.retry_policies, endpoint=endpoint) or self.retry_policy
+        if self.retry_budget:
+            self.retry_budget.deposit()
+
+        attempt = 0
+        used_proxy = None
+        while True:
+            attempt += 1
+            status = json_response = retry_after = error = None
+            try:
+                if semaphore:
+                    async with semaphore:
+                        status, json_response, retry_after, used_proxy = await self._proxied_get(
+                            url=url, endpoint=endpoint, params=params, headers=headers, proxy=proxy,
+                            exclude=used_proxy, attempt=attempt
+                        )
+
+                else:
+                    status, json_response, retry_after, used_proxy = await self._proxied_get(
+                        url=url, endpoint=endpoint, params=params, headers=headers, proxy=proxy,
+                        exclude=used_proxy, attempt=attempt
+                    )
+
+            except CONNECTION_ERRORS as e:
+                error = e
+
+            if (
+                    not policy or not policy.should_retry(attempt=attempt, status_code=status, error=error)
+                    or (self.retry_budget and not self.retry_budget.withdraw())
+            ):
+                if error:
+                    raise error
+
+                return status, json_response
+
+            await asyncio.sleep(policy.delay(attempt=attempt, retry_after=retry_after))
+
+    async def _proxied_get(
+            self, url: str, endpoint: str, params: dict, headers: dict, proxy: Optional[str] = None,
+            exclude: Optional[str] = None, attempt: int = 1
+    ) -> Tuple[int, dict, Optional[float], Optional[str]]:
+        if not proxy and self.proxy_pool is not None:
+            proxy = await self.proxy_pool.acquire(exclude=exclude)
+
+        info = RequestInfo(endpoint=endpoint, url=url, params=params, proxy=proxy, attempt=attempt)
+        for hook in self.on_request_start:
+            hook(info)
+
+        try:
+            status, json_response, retry_after = await self._get(
+                url=url, params=params, headers=headers, proxy=proxy, info=info
+            )
+
+        except Exception as e:
+            info.error = e
+            self._finish(info=info)
+            if self.proxy_pool is not None and proxy in self.proxy_pool and isinstance(e, CONNECTION_ERRORS):
+                self.proxy_pool.report(proxy=proxy, error=True)
+
+            raise
+
+        self._finish(info=info)
+        if self.proxy_pool is not None and proxy in self.proxy_pool:
+            self.proxy_pool.report(
+                proxy=proxy, latency=info.elapsed, status_code=status, retry_after=retry_after
+            )
+
+        return status, json_response, retry_after, proxy
+
+    async def _get(
+            self, url: str, params: dict, headers: dict, proxy: Optional[str] = None, info: Optional[RequestInfo] = None
+    ) -> Tuple[int, dict, Optional[float]]:
+        self.requests += 1
+        status, body, retry_after = await self.transport.get(url=url, params=params, headers=headers, proxy=proxy)
+        if info:
+            info.status_code = status
+            info.size = len(body)
+
+        if status == 200:
+            if self.executor is not None and len(body) >= self.offload_size:
+                json_response = await asyncio.get_running_loop().run_in_executor(self.executor, self.json_loads, body)
+
+            else:
+                json_response = self.json_loads(body)
+
+        else:
+            json_response = {}
+
+        return status, json_response, parse_retry_after(retry_after)
+
+    def _finish(self, info: RequestInfo) -> None:
+        info.elapsed = time.monotonic() - info.started_at
+        if self.metrics is not None:
+            self.metrics.observe(info=info)
+
+        usage = current_usage()
+        if usage:
+            usage.add(info=info)
+
+        for hook in self.on_request_end:
+            hook(info)
+
+    def _cache_hit(self, endpoint: str) -> None:
+        if self.metrics is not None:
+            self.metrics.observe_cache_hit(endpoint=endpoint)
+
+        usage = current_usage()
+        if usage:
+            usage.cache_hits += 1
+
+
+def by_endpoint(values: Dict[str, Any], endpoint: str) -> Any:
+    """
+    Get a value set for an endpoint or its group.
+
+    Args:
+        values (Dict[str, Any]): values by endpoints (e.g. 'nft/collection_list') or endpoint groups (e.g. 'nft').
+        endpoint (str): the endpoint.
+
+    Returns:
+        Any: the value or None.
+
+    """
+    if endpoint in values:
+        return values[endpoint]
+
+    return values.get(endpoint.split('/')[0])
+
+
+def endpoint_name(url: str) -> str:
+    """
+    Get an endpoint name from a URL.
+
+    Args:
+        url (str): a URL, e.g. https://api.debank.com/nft/collection_list
+
+    Returns:
+        str: the endpoint name, e.g. nft/collection_list
+
+    """
+    return urlsplit(url).path.strip('/')
+
+
+def pending_job(json_response: dict) -> bool:
+    """
+    Check whether a response only says that a job preparing the result isn't finished yet, such responses
+    mustn't be cached.
+
+    Args:
+        json_response (dict): the parsed JSON dictionary.
+
+    Returns:
+        bool: True if the job is pending.
+
+    """
+    data = json_response.get('data')
+    return isinstance(data, dict) and bool(data.get('job'))
@@ -0,0 +1,246 @@
+from typing import Optional, Dict, List, Tuple, Iterable
+
+from pretty_utils.type_functions.classes import AutoRepr
+
+from py_debank_async.models import Chain
+
+try:
+    import numpy as np
+
+except ImportError:
+    np = None
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError('NumPy is required for columnar holdings: pip install py-debank-async[numpy]')
+
+
+class TokenTotals(AutoRepr):
+    def __init__(
+            self, chains: 'np.ndarray', token_ids: 'np.ndarray', amount: 'np.ndarray', usd_value: 'np.ndarray',
+            holders: 'np.ndarray'
+    ):
+        self.chains: np.ndarray = chains
+        self.token_ids: np.ndarray = token_ids
+        self.amount: np.ndarray = amount
+        self.usd_value: np.ndarray = usd_value
+        self.holders: np.ndarray = holders
+
+    def __len__(self) -> int:
+        return len(self.token_ids)
+
+    def to_dict(self) -> Dict[Tuple[str, str], float]:
+        """
+        Convert the totals to a dictionary.
+
+        Returns:
+            Dict[Tuple[str, str], float]: USD values by chains and token IDs.
+
+        """
+        return dict(zip(zip(self.chains.tolist(), self.token_ids.tolist()), self.usd_value.tolist()))
+
+
+class Holdings:
+    def __init__(
+            self, addresses: List[str], chains: List[str], tokens: List[Tuple[int, str]], address: 'np.ndarray',
+            chain: 'np.ndarray', token: 'np.ndarray', amount: 'np.ndarray', price: 'np.ndarray',
+            usd_value: 'np.ndarray'
+    ):
+        """
+        Initialize token holdings of many addresses in the struct-of-arrays form, every holding is a position in
+        the arrays. Addresses, chains and tokens are stored once and referenced by indexes.
+
+        Args:
+            addresses (List[str]): addresses referenced by the "address" array.
+            chains (List[str]): chains referenced by the "chain" array.
+            tokens (List[Tuple[int, str]]): chain indexes and IDs of tokens referenced by the "token" array.
+            address (np.ndarray): address indexes of holdings.
+            chain (np.ndarray): chain indexes of holdings.
+            token (np.ndarray): token indexes of holdings.
+            amount (np.ndarray): token amounts.
+            price (np.ndarray): token prices, 0 if they're unknown.
+            usd_value (np.ndarray): USD values of holdings.
+
+        """
+        _require_numpy()
+        self.addresses: List[str] = addresses
+        self.chains: List[str] = chains
+        self.tokens: List[Tuple[int, str]] = tokens
+        self.address: np.ndarray = address
+        self.chain: np.ndarray = chain
+        self.token: np.ndarray = token
+        self.amount: np.ndarray = amount
+        self.price: np.ndarray = price
+        self.usd_value: np.ndarray = usd_value
+
+    def __len__(self) -> int:
+        return len(self.amount)
+
+    def __repr__(self) -> str:
+        return (
+            f'Holdings(holdings={len(self)}, addresses={len(self.addresses)}, chains={len(self.chains)}, '
+            f'tokens={len(self.tokens)})'
+        )
+
+    @classmethod
+    def from_balances(
+            cls, balances: Dict[str, Dict[str, Chain]] or Iterable[Tuple[str, Dict[str, Chain]]]
+    ) -> 'Holdings':
+        """
+        Convert balances of many addresses to holdings, tokens of lazy chains are read without building them.
+
+        Args:
+            balances (Dict[str, Dict[str, Chain]] or Iterable[Tuple[str, Dict[str, Chain]]]): chains by addresses,
+                e.g. results of custom.get_balance or custom.current_balance_list.
+
+        Returns:
+            Holdings: the holdings.
+
+        """
+        _require_numpy()
+        if isinstance(balances, dict):
+            balances = balances.items()
+
+        addresses = []
+        chains = {}
+        tokens = {}
+        address_column = []
+        chain_column = []
+        token_column = []
+        amount_column = []
+        price_column = []
+        for address, address_chains in balances:
+            address_index = len(addresses)
+            addresses.append(address)
+            for chain in address_chains.values():
+                chain_index = chains.setdefault(chain.name, len(chains))
+                lazy = chain.__dict__.get('_lazy')
+                if lazy and 'tokens' in lazy:
+                    holdings = ((token.get('id'), token.get('amount'), token.get('price')) for token in lazy['tokens'])
+
+                else:
+                    holdings = ((token.id, token.amount, token.price) for token in chain.tokens or [])
+
+                for token_id, amount, price in holdings:
+                    address_column.append(address_index)
+                    chain_column.append(chain_index)
+                    token_column.append(tokens.setdefault((chain_index, token_id), len(tokens)))
+                    amount_column.append(amount or 0.0)
+                    price_column.append(price or 0.0)
+
+        amount = np.array(amount_column, dtype=np.float64)
+        price = np.array(price_column, dtype=np.float64)
+        return cls(
+            addresses=addresses, chains=list(chains), tokens=list(tokens),
+            address=np.array(address_column, dtype=np.int32), chain=np.array(chain_column, dtype=np.int16),
+            token=np.array(token_column, dtype=np.int32), amount=amount, price=price, usd_value=amount * price
+        )
+
+    @classmethod
+    def from_chains(cls, address: str, chains: Dict[str, Chain] or List[Chain]) -> 'Holdings':
+        """
+        Convert balances of an address to holdings.
+
+        Args:
+            address (str): the address.
+            chains (Dict[str, Chain] or List[Chain]): chains, e.g. the result of custom.get_balance.
+
+        Returns:
+            Holdings: the holdings.
+
+        """
+        if not isinstance(chains, dict):
+            chains = {chain.name: chain for chain in chains}
+
+        return cls.from_balances(balances=[(address, chains)])
+
+    def select(self, mask: 'np.ndarray') -> 'Holdings':
+        """
+        Get a part of holdings, addresses, chains and tokens are shared with the original.
+
+        Args:
+            mask (np.ndarray): a boolean mask or indexes of holdings.
+
+        Returns:
+            Holdings: the selected holdings.
+
+        """
+        return Holdings(
+            addresses=self.addresses, chains=self.chains, tokens=self.tokens, address=self.address[mask],
+            chain=self.chain[mask], token=self.token[mask], amount=self.amount[mask], price=self.price[mask],
+            usd_value=self.usd_value[mask]
+        )
+
+    def without_dust(self, min_usd_value: float = 1.0) -> 'Holdings':
+        """
+        Drop holdings that are worth less than a threshold.
+
+        Args:
+            min_usd_value (float): the minimum USD value of a holding. (1.0)
+
+        Returns:
+            Holdings: the remaining holdings.
+
+        """
+        return self.select(self.usd_value >= min_usd_value)
+
+    def top(self, count: int) -> 'Holdings':
+        """
+        Get the most valuable holdings.
+
+        Args:
+            count (int): how many holdings to get, none if it isn't positive.
+
+        Returns:
+            Holdings: the holdings sorted by USD value in descending order.
+
+        """
+        if count <= 0:
+            indexes = np.arange(0)
+
+        elif count < len(self):
+            indexes = np.argpartition(self.usd_value, -count)[-count:]
+
+        else:
+            indexes = np.arange(len(self))
+
+        return self.select(indexes[np.argsort(self.usd_value[indexes])[::-1]])
+
+    def totals_by_token(self, min_usd_value: Optional[float] = None) -> TokenTotals:
+        """
+        Sum amounts and USD values of every token over all addresses.
+
+        Args:
+            min_usd_value (Optional[float]): the minimum total USD value of a token. (None)
+
+        Returns:
+            TokenTotals: the totals sorted by USD value in descending order.
+
+        """
+        size = len(self.tokens)
+        amount = np.bincount(self.token, weights=self.amount, minlength=size)
+        usd_value = np.bincount(self.token, weights=self.usd_value, minlength=size)
+        holders = np.bincount(self.token, minlength=size)
+        indexes = np.argsort(usd_value)[::-1]
+        if min_usd_value is not None:
+            indexes = indexes[usd_value[indexes] >= min_usd_value]
+
+        chains = np.array(self.chains, dtype=object)
+        token_chains = np.fromiter((chain for chain, _ in self.tokens), dtype=np.int16, count=size)
+        token_ids = np.array([token_id for _, token_id in self.tokens], dtype=object)
+        return TokenTotals(
+            chains=chains[token_chains[indexes]], token_ids=token_ids[indexes], amount=amount[indexes],
+            usd_value=usd_value[indexes], holders=holders[indexes]
+        )
+
+    def totals_by_address(self) -> Dict[str, float]:
+        """
+        Sum USD values of holdings of every address.
+
+        Returns:
+            Dict[str, float]: the USD values by addresses.
+
+        """
+        usd_value = np.bincount(self.address, weights=self.usd_value, minlength=len(self.addresses))
+        return dict(zip(self.addresses, usd_value.tolist()))
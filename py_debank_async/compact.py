@@ -0,0 +1,78 @@
+from dataclasses import dataclass
+
+from py_debank_async import models
+
+
+class SlotsRepr:
+    """
+    A base of memory-efficient versions of the models that are created in large numbers. They have the same
+    public attributes, constructors and representation as the models with the same names, but store attributes
+    in slots instead of a per-instance dictionary.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        values = ('{}={!r}'.format(key, getattr(self, key)) for key in self.__slots__ if hasattr(self, key))
+        return '{}({})'.format(self.__class__.__name__, ', '.join(values))
+
+
+@dataclass(slots=True)
+class Mark:
+    timestamp: int
+    usd_value: float
+
+
+class Token(SlotsRepr):
+    __slots__ = (
+        'chain', 'symbol', 'usd_value', 'amount', 'price', 'decimals', 'display_symbol', 'id', 'is_core',
+        'is_verified', 'is_wallet', 'logo_url', 'name', 'optimized_symbol', 'protocol_id', 'timestamp'
+    )
+    __init__ = models.Token.__init__
+
+
+class Collection(SlotsRepr):
+    __slots__ = (
+        'chain', 'name', 'id', 'nft_amount', 'spent_token', 'avg_price_24h', 'avg_price_last_24h', 'floor_price',
+        'floor_price_24h', 'max_price_24h', 'max_price_last_24h', 'volume_24h', 'volume_last_24h', 'description',
+        'is_core', 'is_visible', 'logo_url', 'rank_at', 'thirdparty'
+    )
+    token_class = Token
+    __init__ = models.Collection.__init__
+
+
+class NFT(SlotsRepr):
+    __slots__ = (
+        'chain', 'collection', 'name', 'contract_id', 'usd_spent', 'amount', 'mint_gas_token', 'mint_pay_token',
+        'pay_token', 'content', 'content_type', 'detail_url', 'id', 'inner_id', 'minter', 'thumbnail_url'
+    )
+    token_class = Token
+    __init__ = models.NFT.__init__
+
+
+class NFTTx(SlotsRepr):
+    __slots__ = ('chain', 'type', 'tx_id', 'timestamp', 'address', 'nft', 'pay_token', 'id')
+    token_class = Token
+    nft_class = NFT
+    collection_class = Collection
+    __init__ = models.NFTTx.__init__
+
+
+class Tx(SlotsRepr):
+    __slots__ = (
+        'chain', 'type', 'tx_id', 'timestamp', 'sender', 'recipient', 'receives', 'sends', 'token_approve',
+        'eth_gas_fee', 'usd_gas_fee', 'project'
+    )
+    token_class = Token
+    nft_class = NFT
+    project_class = models.Project
+    __init__ = models.Tx.__init__
+    _parse_transfers = models.Tx._parse_transfers
+
+
+class NFTHistory(models.NFTHistory):
+    tx_class = NFTTx
+
+
+class History(models.History):
+    tx_class = Tx
@@ -1,15 +1,21 @@
+import asyncio
 from typing import Dict, Optional, List
 
 from py_debank_async import nft
 from py_debank_async import portfolio
 from py_debank_async import token
+from py_debank_async.client import DebankClient
+from py_debank_async.exceptions import JobTimeoutException
 from py_debank_async.models import Chain, ChainNames
 from py_debank_async.token import balance_list
 from py_debank_async.user import addr
+from py_debank_async.utils import gather_limited
 
 
 async def get_balance(
-        address: str, chain: ChainNames or str = '', parse_nfts: bool = True, proxies: Optional[str or List[str]] = None
+        address: str, chain: ChainNames or str = '', parse_nfts: bool = True,
+        proxies: Optional[str or List[str]] = None, client: Optional[DebankClient] = None, concurrency: int = 5,
+        lazy: bool = False, deadline: float = 30.0
 ) -> Dict[str, Chain]:
     """
     Get the following information of an address of one or all chains:
@@ -18,67 +24,107 @@ async def get_balance(
     - projects where the account's assets are located
     - owned NFTs
 
+    Token balances, NFTs and projects are requested concurrently.
+
     Args:
         address (str): an address.
         chain (ChainNames or str): a chain. (all chains)
         parse_nfts (bool): whether to parse NFT, it leads to a high probability of "429 Too Many Requests" error. (True)
         proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
             a request. (None)
+        client (Optional[DebankClient]): a client with a persistent connection pool for making a request. (None)
+        concurrency (int): how many chains can be requested at the same time, 0 means no limit. (5)
+        lazy (bool): if True, nested objects are built only when they are accessed. (False)
+        deadline (float): how many seconds to wait for DeBank to prepare the NFT collections of all chains. (30.0)
 
     Returns:
         Chain: the address information.
 
+    Raises:
+        JobTimeoutException: if NFT collections of some chains weren't prepared before the deadline, the address
+            information with NFTs of the other chains is in the "results" attribute.
+
     """
     chains: Dict[str, Chain] = {}
+    pending_chains: List[str] = []
+
+    async def nft_collections(chain: ChainNames or str = '') -> Dict[str, list]:
+        try:
+            return await nft.collection_list(
+                address=address, chain=chain, raw_data=True, proxies=proxies, client=client, deadline=deadline
+            )
+
+        except JobTimeoutException as e:
+            pending_chains.extend(e.pending_chains)
+            return e.results
+
     if chain:
-        tokens = await token.balance_list(address=address, chain=chain, proxies=proxies)
+        requests = [
+            token.balance_list(address=address, chain=chain, lazy=lazy, proxies=proxies, client=client),
+            portfolio.project_list(address=address, raw_data=True, proxies=proxies, client=client)
+        ]
+        if parse_nfts:
+            requests.append(nft_collections(chain=chain))
+
+        tokens, projects, *nfts = await asyncio.gather(*requests)
         chains.update({chain: tokens})
 
-        if parse_nfts:
-            nfts = await nft.collection_list(address=address, chain=chain, raw_data=True, proxies=proxies)
-            if nfts:
-                chains[chain].parse_nfts(nfts[chain])
+        if nfts and chain in nfts[0]:
+            chains[chain].parse_nfts(nfts[0][chain])
 
-        projects = await portfolio.project_list(address=address, raw_data=True, proxies=proxies)
         if chain in projects:
             chains[chain].parse_projects(projects[chain])
 
     else:
-        tokens = await current_balance_list(address=address, proxies=proxies)
+        requests = [
+            current_balance_list(
+                address=address, lazy=lazy, concurrency=concurrency, proxies=proxies, client=client
+            ),
+            portfolio.project_list(address=address, raw_data=True, proxies=proxies, client=client)
+        ]
+        if parse_nfts:
+            requests.append(nft_collections())
+
+        tokens, projects, *nfts = await asyncio.gather(*requests)
         chains.update(tokens)
 
-        if parse_nfts:
-            nfts = await nft.collection_list(address=address, raw_data=True, proxies=proxies)
-            for name, nft_dict in nfts.items():
+        if nfts:
+            for name, nft_dict in nfts[0].items():
                 if name in chains:
                     chains[name].parse_nfts(nft_dict)
 
                 else:
-                    chains[name] = Chain(name=name, tokens=nft_dict)
+                    chains[name] = Chain(name=name, collections=nft_dict, lazy=lazy)
 
-        projects = await portfolio.project_list(address=address, raw_data=True, proxies=proxies)
         for name, project_dict in projects.items():
             if name in chains:
                 chains[name].parse_projects(project_dict)
 
             else:
-                chains[name] = Chain(name=name, projects=project_dict)
+                chains[name] = Chain(name=name, projects=project_dict, lazy=lazy)
 
     chains = {key: value for key, value in sorted(chains.items(), key=lambda item: item[1].usd_value, reverse=True)}
+    if pending_chains:
+        raise JobTimeoutException(pending_chains=pending_chains, results=chains)
+
     return chains
 
 
 async def current_balance_list(
-        address: str, raw_data: bool = False, proxies: Optional[str or List[str]] = None
+        address: str, raw_data: bool = False, proxies: Optional[str or List[str]] = None,
+        client: Optional[DebankClient] = None, concurrency: int = 5, lazy: bool = False
 ) -> Dict[str, Chain] or Dict[str, dict]:
     """
-    Get current token balances of an address of all chains.
+    Get current token balances of an address of all chains. The chains are requested concurrently.
 
     Args:
         address (str): an address.
         raw_data: if True, it will return the unprocessed dictionary. (False)
         proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
             a request. (None)
+        client (Optional[DebankClient]): a client with a persistent connection pool for making a request. (None)
+        concurrency (int): how many chains can be requested at the same time, 0 means no limit. (5)
+        lazy (bool): if True, nested objects are built only when they are accessed. (False)
 
     Returns:
         Dict[str, Chain] or Dict[str, dict]: token balances.
@@ -91,10 +137,21 @@ async def current_balance_list(
 
     """
     chain_dict = {}
-    used_chains = (await addr(address=address, proxies=proxies)).used_chains
-    for chain in used_chains:
-        balance = await balance_list(address=address, chain=chain, raw_data=raw_data, proxies=proxies)
-        if balance.tokens:
+    used_chains = (await addr(address=address, proxies=proxies, client=client)).used_chains
+    balances = await gather_limited(
+        (
+            balance_list(
+                address=address, chain=chain, raw_data=raw_data, lazy=lazy, proxies=proxies, client=client
+            )
+            for chain in used_chains
+        ), limit=concurrency
+    )
+    for chain, balance in zip(used_chains, balances):
+        if raw_data:
+            if balance[chain]:
+                chain_dict[chain] = balance[chain]
+
+        elif balance.has_tokens():
             chain_dict[chain] = balance
 
     if not raw_data:
@@ -0,0 +1,18 @@
+import json
+from typing import Any
+
+
+def loads(body: bytes or str) -> Any:
+    """
+    Parse a JSON document using the standard library. It keeps integers of any size exact, e.g. "raw_amount" values
+    that exceed 64 bits, faster parsers such as orjson can be plugged in with DebankClient(json_loads=...) if
+    the precision of such values doesn't matter.
+
+    Args:
+        body (bytes or str): the raw JSON document, e.g. a response body.
+
+    Returns:
+        Any: the parsed document.
+
+    """
+    return json.loads(body)
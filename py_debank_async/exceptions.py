@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, List, Dict, Any
 
 
 class DebankException(Exception):
@@ -8,3 +8,27 @@ class DebankException(Exception):
 
     def __str__(self):
         return f'Status code: {self.status_code}, Error message: {self.error_msg}'
+
+    def __reduce__(self):
+        return _restore, (self.__class__, self.__dict__)
+
+
+class JobTimeoutException(DebankException):
+    def __init__(self, pending_chains: List[str], results: Dict[str, Any]):
+        super().__init__(
+            status_code=200, error_msg=f'jobs were not finished before the deadline for chains: {pending_chains}'
+        )
+        self.pending_chains: List[str] = pending_chains
+        self.results: Dict[str, Any] = results
+
+
+class ReplayMissException(DebankException):
+    def __init__(self, key: str):
+        super().__init__(status_code=404, error_msg=f'there is no recorded response for the request: {key}')
+        self.key: str = key
+
+
+def _restore(cls: type, state: dict) -> DebankException:
+    exception = cls.__new__(cls)
+    exception.__dict__.update(state)
+    return exception
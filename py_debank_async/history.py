@@ -1,12 +1,18 @@
-from typing import Optional, List
+from typing import Optional, List, AsyncIterator, Iterable, Tuple, Dict
 
-from py_debank_async.models import Entrypoints, History, ChainNames
-from py_debank_async.utils import get_proxy, async_get, check_response, get_headers
+from py_debank_async.client import DebankClient
+from py_debank_async.limiter import RateLimiter
+from py_debank_async.models import Entrypoints, History, ChainNames, Tx, Token
+from py_debank_async.store import SyncStore
+from py_debank_async.user import addr
+from py_debank_async.utils import (
+    get_proxy, async_get, check_response, get_headers, gather_limited, merge_descending, build
+)
 
 
 async def list_(
         address: str, chain: ChainNames or str = '', start_time: int or str = 0, page_count: int or str = 20,
-        proxies: Optional[str or List[str]] = None
+        proxies: Optional[str or List[str]] = None, client: Optional[DebankClient] = None, by_chain: bool = False
 ) -> History:
     """
     Get a transaction history of an address.
@@ -18,11 +24,24 @@ async def list_(
         page_count (int or str): how many recent transactions to parse. (20)
         proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
             a request. (None)
+        client (Optional[DebankClient]): a client with a persistent connection pool for making a request. (None)
+        by_chain (bool): if True and the chain isn't specified, the chains used by the address are requested
+            concurrently with a separate cursor for every chain, see iter_txs_by_chain. (False)
 
     Returns:
         History: the transaction history.
 
     """
+    page_count = int(page_count)
+    if by_chain and not chain:
+        history = History(address=address, data={})
+        history.txs = [
+            tx async for tx in iter_txs_by_chain(
+                address=address, start_time=start_time, limit=page_count, proxies=proxies, client=client
+            )
+        ] or None
+        return history
+
     data = {}
     if page_count <= 20:
         params = {
@@ -33,7 +52,7 @@ async def list_(
         }
         status_code, json_response = await async_get(
             url=Entrypoints.PUBLIC.HISTORY + 'list', params=params, headers=await get_headers(),
-            proxy=await get_proxy(proxy=proxies)
+            proxy=await get_proxy(proxy=proxies), client=client
         )
         await check_response(status_code=status_code, json_response=json_response)
         data = json_response['data']
@@ -50,7 +69,7 @@ async def list_(
             }
             status_code, json_response = await async_get(
                 url=Entrypoints.PUBLIC.HISTORY + 'list', params=params,
-                headers=await get_headers(), proxy=await get_proxy(proxy=proxies)
+                headers=await get_headers(), proxy=await get_proxy(proxy=proxies), client=client
             )
             await check_response(status_code=status_code, json_response=json_response)
             if data:
@@ -63,12 +82,150 @@ async def list_(
 
             start_time = int(data['history_list'][-1]['time_at'])
 
-    return History(address=address, data=data)
+    return await build(History, items=len(data.get('history_list') or []), client=client, address=address, data=data)
+
+
+async def iter_txs(
+        address: str, chain: ChainNames or str = '', start_time: int or str = 0, limit: Optional[int] = None,
+        page_count: int = 20, proxies: Optional[str or List[str]] = None, client: Optional[DebankClient] = None
+) -> AsyncIterator[Tx]:
+    """
+    Iterate over a transaction history of an address page by page, so only one page is kept in memory.
+
+    Args:
+        address (str): an address.
+        chain (ChainNames or str): a chain. (all chains)
+        start_time (int or str): before what time to parse transactions. (0)
+        limit (Optional[int]): how many recent transactions to parse. (all transactions)
+        page_count (int): how many transactions to request at a time, no more than 20. (20)
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request. (None)
+        client (Optional[DebankClient]): a client with a persistent connection pool for making a request. (None)
+
+    Returns:
+        AsyncIterator[Tx]: the transactions from newest to oldest.
+
+    """
+    page_count = min(page_count, 20)
+    while limit is None or limit > 0:
+        if limit is not None:
+            page_count = min(page_count, limit)
+
+        params = {
+            'user_addr': address,
+            'chain': chain,
+            'start_time': str(start_time),
+            'page_count': str(page_count)
+        }
+        status_code, json_response = await async_get(
+            url=Entrypoints.PUBLIC.HISTORY + 'list', params=params, headers=await get_headers(),
+            proxy=await get_proxy(proxy=proxies), client=client
+        )
+        await check_response(status_code=status_code, json_response=json_response)
+        data = json_response['data']
+        txs = History(address=address, data=data).txs
+        if not txs:
+            return
+
+        for tx in txs:
+            yield tx
+
+        if limit is not None:
+            limit -= len(txs)
+
+        if len(txs) < page_count:
+            return
+
+        start_time = int(data['history_list'][-1]['time_at'])
+
+
+async def iter_txs_by_chain(
+        address: str, chains: Optional[List[ChainNames or str]] = None, start_time: int or str = 0,
+        limit: Optional[int] = None, page_count: int = 20, proxies: Optional[str or List[str]] = None,
+        client: Optional[DebankClient] = None
+) -> AsyncIterator[Tx]:
+    """
+    Iterate over a transaction history of an address with a separate cursor for every chain. The chains are
+    requested concurrently and their pages are merged into one stream, so a deep history of a multi-chain
+    address is received faster than with one cursor through all chains.
+
+    Args:
+        address (str): an address.
+        chains (Optional[List[ChainNames or str]]): chains. (the chains used by the address)
+        start_time (int or str): before what time to parse transactions. (0)
+        limit (Optional[int]): how many recent transactions to parse, the chains stop being requested after
+            that. (all transactions)
+        page_count (int): how many transactions of a chain to request at a time, no more than 20. (20)
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request. (None)
+        client (Optional[DebankClient]): a client with a persistent connection pool for making a request. (None)
+
+    Returns:
+        AsyncIterator[Tx]: the transactions of all chains from newest to oldest.
+
+    """
+    if chains is None:
+        chains = (await addr(address=address, proxies=proxies, client=client)).used_chains or []
+
+    iterators = [
+        iter_txs(
+            address=address, chain=chain, start_time=start_time, limit=limit, page_count=page_count,
+            proxies=proxies, client=client
+        ) for chain in chains
+    ]
+    async for tx in merge_descending(
+            iterators=iterators, key=lambda tx: tx.timestamp, limit=limit, prefetch=min(page_count, 20)
+    ):
+        yield tx
+
+
+async def sync(
+        address: str, store: SyncStore, chain: ChainNames or str = '', initial_limit: Optional[int] = None,
+        proxies: Optional[str or List[str]] = None, client: Optional[DebankClient] = None
+) -> List[Tx]:
+    """
+    Get transactions of an address made since the previous synchronization. Pages are requested from newest to
+    oldest only until an already seen transaction is reached, so the number of requests depends on the new
+    activity. The high-water mark is saved to the store after all new transactions are received.
+
+    Args:
+        address (str): an address.
+        store (SyncStore): a store of high-water marks.
+        chain (ChainNames or str): a chain. (all chains)
+        initial_limit (Optional[int]): how many recent transactions to get on the first synchronization.
+            (all transactions)
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request. (None)
+        client (Optional[DebankClient]): a client with a persistent connection pool for making a request. (None)
+
+    Returns:
+        List[Tx]: the new transactions from newest to oldest.
+
+    """
+    mark = store.get(address=address, chain=chain)
+    txs = []
+    async for tx in iter_txs(
+            address=address, chain=chain, limit=None if mark else initial_limit, proxies=proxies, client=client
+    ):
+        if mark and (tx.timestamp < mark[0] or (tx.timestamp == mark[0] and tx.tx_id in mark[1])):
+            break
+
+        txs.append(tx)
+
+    if txs:
+        time_at = txs[0].timestamp
+        tx_ids = {tx.tx_id for tx in txs if tx.timestamp == time_at}
+        if mark and mark[0] == time_at:
+            tx_ids |= mark[1]
+
+        store.set(address=address, chain=chain, time_at=time_at, tx_ids=tx_ids)
+
+    return txs
 
 
 async def token_price(
         token_id: str, chain: ChainNames or str, time_at: Optional[int or str] = None,
-        proxies: Optional[str or List[str]] = None
+        proxies: Optional[str or List[str]] = None, client: Optional[DebankClient] = None
 ) -> float:
     """
     Get a token price at a certain point in time.
@@ -79,6 +236,7 @@ async def token_price(
         time_at (Optional[int or str]): at what point in time to get a token price. (current time)
         proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
             a request. (None)
+        client (Optional[DebankClient]): a client with a persistent connection pool for making a request. (None)
 
     Returns:
         float: the token price.
@@ -93,7 +251,75 @@ async def token_price(
 
     status_code, json_response = await async_get(
         url=Entrypoints.PUBLIC.HISTORY + 'token_price', params=params, headers=await get_headers(),
-        proxy=await get_proxy(proxy=proxies)
+        proxy=await get_proxy(proxy=proxies), client=client
     )
     await check_response(status_code=status_code, json_response=json_response)
     return json_response['data']['price']
+
+
+async def token_prices(
+        queries: Iterable[Tuple[str, ChainNames or str, Optional[int]]], bucket: Optional[int] = None,
+        known: Optional[Iterable[dict or Token]] = None, concurrency: int = 10, rate: Optional[float] = None,
+        proxies: Optional[str or List[str]] = None, client: Optional[DebankClient] = None
+) -> Dict[Tuple[str, ChainNames or str, Optional[int]], float]:
+    """
+    Get prices of many tokens at many points in time, each unique price is requested only once.
+
+    Args:
+        queries (Iterable[Tuple[str, ChainNames or str, Optional[int]]]): token IDs, chains and points in time,
+            None as a point in time means the current time.
+        bucket (Optional[int]): a number of seconds to round points in time down to, e.g. 3600 to request one
+            price per hour. (exact points in time)
+        known (Optional[Iterable[dict or Token]]): tokens with current prices that are already known and don't
+            need to be requested, e.g. the "balance_list" response or the "token_dict" values of a transaction
+            history, they answer queries without a point in time only. (None)
+        concurrency (int): how many prices can be requested at the same time. (10)
+        rate (Optional[float]): how many prices can be requested per second. (no limit)
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request. (None)
+        client (Optional[DebankClient]): a client with a persistent connection pool for making a request. (None)
+
+    Returns:
+        Dict[Tuple[str, ChainNames or str, Optional[int]], float]: prices by the original queries.
+
+    """
+    def snap(time_at: Optional[int or str]) -> Optional[int]:
+        if time_at is None:
+            return
+
+        time_at = int(float(time_at))
+        return time_at - time_at % bucket if bucket else time_at
+
+    def resolved_key(token_id: str, chain: str, time_at: Optional[int or str]) -> Tuple[str, str, Optional[int]]:
+        return token_id.lower(), chain, snap(time_at)
+
+    queries = list(queries)
+    prices = {}
+    for token in known or []:
+        if isinstance(token, Token):
+            token_id, chain, price = token.id, token.chain, token.price
+
+        else:
+            token_id, chain, price = token.get('id'), token.get('chain'), token.get('price')
+
+        if token_id and chain and price is not None:
+            prices[resolved_key(token_id=token_id, chain=chain, time_at=None)] = price
+
+    missing = []
+    for token_id, chain, time_at in queries:
+        key = resolved_key(token_id=token_id, chain=chain, time_at=time_at)
+        if key not in prices:
+            prices[key] = None
+            missing.append(key)
+
+    limiter = RateLimiter(rate=rate, burst=concurrency) if rate else None
+
+    async def request(token_id: str, chain: str, time_at: Optional[int]) -> float:
+        if limiter:
+            await limiter.acquire()
+
+        return await token_price(token_id=token_id, chain=chain, time_at=time_at, proxies=proxies, client=client)
+
+    resolved = await gather_limited((request(*key) for key in missing), limit=concurrency)
+    prices.update(zip(missing, resolved))
+    return {query: prices[resolved_key(*query)] for query in queries}
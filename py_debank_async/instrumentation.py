@@ -0,0 +1,232 @@
+import bisect
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, Dict, List, Tuple, Iterator, Awaitable, Any
+
+from pretty_utils.type_functions.classes import AutoRepr
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_usage: ContextVar[Optional['Usage']] = ContextVar('usage', default=None)
+
+
+class RequestInfo(AutoRepr):
+    def __init__(self, endpoint: str, url: str, params: dict, proxy: Optional[str] = None, attempt: int = 1):
+        self.endpoint: str = endpoint
+        self.url: str = url
+        self.params: dict = params
+        self.proxy: Optional[str] = proxy
+        self.attempt: int = attempt
+        self.started_at: float = time.monotonic()
+        self.elapsed: Optional[float] = None
+        self.status_code: Optional[int] = None
+        self.size: int = 0
+        self.error: Optional[Exception] = None
+
+
+class Usage(AutoRepr):
+    def __init__(self):
+        self.requests: int = 0
+        self.retries: int = 0
+        self.errors: int = 0
+        self.cache_hits: int = 0
+        self.size: int = 0
+        self.request_time: float = 0.0
+        self.wall_time: float = 0.0
+        self.endpoints: Dict[str, int] = {}
+
+    def add(self, info: RequestInfo) -> None:
+        self.requests += 1
+        self.size += info.size
+        self.request_time += info.elapsed or 0.0
+        self.endpoints[info.endpoint] = self.endpoints.get(info.endpoint, 0) + 1
+        if info.attempt > 1:
+            self.retries += 1
+
+        if info.error or info.status_code != 200:
+            self.errors += 1
+
+
+class EndpointMetrics(AutoRepr):
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.requests: int = 0
+        self.retries: int = 0
+        self.errors: int = 0
+        self.cache_hits: int = 0
+        self.size: int = 0
+        self.statuses: Dict[int, int] = {}
+        self.buckets: Tuple[float, ...] = buckets
+        self.bucket_counts: List[int] = [0] * (len(buckets) + 1)
+        self.latency_sum: float = 0.0
+
+    def quantile(self, share: float) -> Optional[float]:
+        """
+        Estimate a latency quantile from the histogram.
+
+        Args:
+            share (float): the quantile, e.g. 0.99.
+
+        Returns:
+            Optional[float]: the upper bound of the bucket containing the quantile in seconds, infinity if it's
+                beyond the last bucket, or None if there were no requests.
+
+        """
+        total = sum(self.bucket_counts)
+        if not total:
+            return
+
+        rank = share * total
+        count = 0
+        for bound, bucket_count in zip(self.buckets + (float('inf'),), self.bucket_counts):
+            count += bucket_count
+            if count >= rank:
+                return bound
+
+        return float('inf')
+
+
+class Metrics:
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        """
+        Initialize counters and latency histograms of requests per endpoint. Pass the metrics to a DebankClient
+        to collect them.
+
+        Args:
+            buckets (Tuple[float, ...]): upper bounds of latency histogram buckets in seconds.
+                (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+        """
+        self.buckets: Tuple[float, ...] = buckets
+        self.endpoints: Dict[str, EndpointMetrics] = {}
+
+    def _endpoint(self, endpoint: str) -> EndpointMetrics:
+        metrics = self.endpoints.get(endpoint)
+        if not metrics:
+            metrics = self.endpoints[endpoint] = EndpointMetrics(buckets=self.buckets)
+
+        return metrics
+
+    def observe(self, info: RequestInfo) -> None:
+        """
+        Take into account a finished request.
+
+        Args:
+            info (RequestInfo): the request information.
+
+        """
+        metrics = self._endpoint(info.endpoint)
+        metrics.requests += 1
+        metrics.size += info.size
+        if info.attempt > 1:
+            metrics.retries += 1
+
+        if info.error:
+            metrics.errors += 1
+
+        else:
+            metrics.statuses[info.status_code] = metrics.statuses.get(info.status_code, 0) + 1
+
+        if info.elapsed is not None:
+            metrics.bucket_counts[bisect.bisect_left(self.buckets, info.elapsed)] += 1
+            metrics.latency_sum += info.elapsed
+
+    def observe_cache_hit(self, endpoint: str) -> None:
+        self._endpoint(endpoint).cache_hits += 1
+
+    def reset(self) -> None:
+        self.endpoints.clear()
+
+    def to_prometheus(self, prefix: str = 'debank') -> str:
+        """
+        Export the metrics in the Prometheus text format.
+
+        Args:
+            prefix (str): a prefix of metric names. (debank)
+
+        Returns:
+            str: the metrics.
+
+        """
+        lines = []
+
+        def header(name: str, metric_type: str, description: str) -> None:
+            lines.append(f'# HELP {prefix}_{name} {description}')
+            lines.append(f'# TYPE {prefix}_{name} {metric_type}')
+
+        endpoints = sorted(self.endpoints.items())
+        header('requests_total', 'counter', 'Requests by endpoint and status code.')
+        for endpoint, metrics in endpoints:
+            for status_code, count in sorted(metrics.statuses.items()):
+                lines.append(f'{prefix}_requests_total{{endpoint="{endpoint}",status="{status_code}"}} {count}')
+
+        for name, attribute, description in (
+                ('connection_errors_total', 'errors', 'Requests failed with a connection error.'),
+                ('retries_total', 'retries', 'Repeated attempts of requests.'),
+                ('cache_hits_total', 'cache_hits', 'Responses taken from caches.'),
+                ('response_bytes_total', 'size', 'Size of response bodies.')
+        ):
+            header(name, 'counter', description)
+            for endpoint, metrics in endpoints:
+                lines.append(f'{prefix}_{name}{{endpoint="{endpoint}"}} {getattr(metrics, attribute)}')
+
+        header('request_duration_seconds', 'histogram', 'Duration of requests.')
+        for endpoint, metrics in endpoints:
+            count = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), metrics.bucket_counts):
+                count += bucket_count
+                bound = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'{prefix}_request_duration_seconds_bucket{{endpoint="{endpoint}",le="{bound}"}} {count}')
+
+            lines.append(f'{prefix}_request_duration_seconds_sum{{endpoint="{endpoint}"}} {metrics.latency_sum}')
+            lines.append(f'{prefix}_request_duration_seconds_count{{endpoint="{endpoint}"}} {count}')
+
+        return '\n'.join(lines) + '\n'
+
+
+def current_usage() -> Optional[Usage]:
+    return _usage.get()
+
+
+@contextmanager
+def usage() -> Iterator[Usage]:
+    """
+    Count requests made inside the block, including ones made by tasks it starts, and its wall time. Blocks can be
+    nested, an outer one counts the requests of inner ones too.
+    """
+    current = Usage()
+    outer = _usage.get()
+    token = _usage.set(current)
+    started_at = time.monotonic()
+    try:
+        yield current
+
+    finally:
+        current.wall_time = time.monotonic() - started_at
+        _usage.reset(token)
+        if outer:
+            outer.requests += current.requests
+            outer.retries += current.retries
+            outer.errors += current.errors
+            outer.cache_hits += current.cache_hits
+            outer.size += current.size
+            outer.request_time += current.request_time
+            for endpoint, count in current.endpoints.items():
+                outer.endpoints[endpoint] = outer.endpoints.get(endpoint, 0) + count
+
+
+async def measure(awaitable: Awaitable) -> Tuple[Any, Usage]:
+    """
+    Await a call and count the requests it made, e.g. result, usage = await measure(custom.get_balance(...)).
+
+    Args:
+        awaitable (Awaitable): the call.
+
+    Returns:
+        Tuple[Any, Usage]: the result of the call and its usage.
+
+    """
+    with usage() as call_usage:
+        result = await awaitable
+
+    return result, call_usage
@@ -0,0 +1,131 @@
+import asyncio
+from typing import Optional, List, Dict, Any
+
+from py_debank_async.client import DebankClient
+from py_debank_async.exceptions import JobTimeoutException
+from py_debank_async.utils import get_proxy, check_response, async_get, get_headers, gather_limited
+
+
+class JobPoller:
+    def __init__(
+            self, min_interval: float = 0.5, max_interval: float = 5.0, smoothing: float = 0.3, concurrency: int = 0
+    ):
+        """
+        Initialize a poller for endpoints that answer with a "job" until their result is ready.
+
+        The poller remembers how long jobs take to become ready and waits accordingly, falling back to
+        an exponential backoff while nothing has been observed yet.
+
+        Args:
+            min_interval (float): the minimum pause between polls of a job in seconds. (0.5)
+            max_interval (float): the maximum pause between polls of a job in seconds. (5.0)
+            smoothing (float): a weight of the latest readiness time in the average readiness time. (0.3)
+            concurrency (int): how many chains can be polled at the same time, 0 means no limit. (0)
+
+        """
+        self.min_interval: float = min_interval
+        self.max_interval: float = max_interval
+        self.smoothing: float = smoothing
+        self.concurrency: int = concurrency
+        self.ready_time: Optional[float] = None
+
+    def observe(self, ready_time: float) -> None:
+        """
+        Take into account how long a job took to become ready.
+
+        Args:
+            ready_time (float): seconds passed from the first poll of a job until its result was received.
+
+        """
+        if self.ready_time is None:
+            self.ready_time = ready_time
+
+        else:
+            self.ready_time += self.smoothing * (ready_time - self.ready_time)
+
+    def interval(self, elapsed: float, attempt: int) -> float:
+        """
+        Get a pause before the next poll of a job.
+
+        Args:
+            elapsed (float): seconds passed from the first poll of the job.
+            attempt (int): how many times the job has already been polled.
+
+        Returns:
+            float: the pause in seconds.
+
+        """
+        if self.ready_time is not None and self.ready_time > elapsed:
+            interval = self.ready_time - elapsed
+
+        else:
+            interval = self.min_interval * 2 ** (attempt - 1)
+
+        return min(max(interval, self.min_interval), self.max_interval)
+
+    async def poll(
+            self, url: str, address: str, chains: List[str], deadline: float = 30.0,
+            proxies: Optional[str or List[str]] = None, client: Optional[DebankClient] = None
+    ) -> Dict[str, Any]:
+        """
+        Poll an endpoint for all chains concurrently until every job is finished.
+
+        Args:
+            url (str): a URL of the endpoint.
+            address (str): an address.
+            chains (List[str]): chains.
+            deadline (float): how many seconds to wait for the jobs. (30.0)
+            proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+                a request. (None)
+            client (Optional[DebankClient]): a client with a persistent connection pool for making a request. (None)
+
+        Returns:
+            Dict[str, Any]: job results by chains.
+
+        Raises:
+            JobTimeoutException: if some jobs weren't finished before the deadline, the finished ones are in
+                the "results" attribute.
+            DebankException: if a poll of some chain failed, the polls of the other chains are cancelled.
+
+        """
+        loop = asyncio.get_running_loop()
+        finish_at = loop.time() + deadline
+        results = {}
+
+        async def poll_chain(chain: str) -> None:
+            proxy = await get_proxy(proxy=proxies)
+            params = {
+                'user_addr': address,
+                'chain': chain
+            }
+            started_at = loop.time()
+            attempt = 0
+            while True:
+                status_code, json_response = await async_get(
+                    url=url, params=params, headers=await get_headers(), proxy=proxy, client=client
+                )
+                await check_response(status_code=status_code, json_response=json_response)
+                attempt += 1
+                if not json_response['data']['job']:
+                    if attempt > 1:
+                        self.observe(loop.time() - started_at)
+
+                    results[chain] = json_response['data']['result']['data']
+                    return
+
+                remaining = finish_at - loop.time()
+                if remaining <= 0:
+                    return
+
+                await asyncio.sleep(min(self.interval(elapsed=loop.time() - started_at, attempt=attempt), remaining))
+
+        await gather_limited((poll_chain(chain) for chain in chains), limit=self.concurrency)
+        results = {chain: results[chain] for chain in chains if chain in results}
+        pending_chains = [chain for chain in chains if chain not in results]
+        if pending_chains:
+            raise JobTimeoutException(pending_chains=pending_chains, results=results)
+
+        return results
+
+
+poller = JobPoller()
@@ -0,0 +1,61 @@
+import asyncio
+import time
+
+from pretty_utils.type_functions.classes import AutoRepr
+
+
+class RateLimiter(AutoRepr):
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize a token bucket that allows a certain number of actions per second.
+
+        Args:
+            rate (float): how many actions are allowed per second.
+            burst (int): how many actions can be made at once after a pause. (1)
+
+        """
+        self.rate: float = rate
+        self.burst: int = burst
+        self.tokens: float = burst
+        self.updated_at: float = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def delay(self) -> float:
+        """
+        Get how many seconds are left until an action is allowed.
+
+        Returns:
+            float: the number of seconds, 0 if an action is allowed right now.
+
+        """
+        self._refill()
+        if self.tokens >= 1:
+            return 0.0
+
+        return (1 - self.tokens) / self.rate
+
+    def try_acquire(self) -> bool:
+        """
+        Take an action from the budget if it's allowed right now.
+
+        Returns:
+            bool: True if the action is allowed.
+
+        """
+        self._refill()
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+
+        return False
+
+    async def acquire(self) -> None:
+        """
+        Wait until an action is allowed and take it from the budget.
+        """
+        while not self.try_acquire():
+            await asyncio.sleep(self.delay())
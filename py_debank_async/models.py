@@ -1,5 +1,6 @@
+import heapq
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional, List, Set, Dict
 
 from pretty_utils.type_functions.classes import AutoRepr
 
@@ -78,8 +79,35 @@ class Token(AutoRepr):
             self.usd_value = self.amount * self.price
 
 
-class PortfolioItem(AutoRepr):
-    def __init__(self, data: dict):
+class LazyModel(AutoRepr):
+    """
+    A model that can keep raw data of some attributes and build them only on the first access.
+    """
+
+    def __getattr__(self, name: str):
+        lazy = self.__dict__.get('_lazy')
+        if lazy and name in lazy:
+            value = getattr(self, f'_build_{name}')(lazy.pop(name))
+            setattr(self, name, value)
+            return value
+
+        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+    def __repr__(self) -> str:
+        values = ['{}={!r}'.format(key, value) for key, value in vars(self).items() if not key.startswith('_')]
+        values.extend(f'{name}=<deferred>' for name in self.__dict__.get('_lazy') or {})
+        return '{}({})'.format(self.__class__.__name__, ', '.join(values))
+
+    def _defer(self, name: str, data) -> None:
+        self.__dict__.pop(name, None)
+        self._lazy[name] = data
+
+
+class PortfolioItem(LazyModel):
+    def __init__(self, data: dict, lazy: bool = False):
+        if lazy:
+            self._lazy: dict = {}
+
         self.name: str = data.get('name')
         self.asset_usd_value: float = data.get('stats')['asset_usd_value']
         self.debt_usd_value: float = data.get('stats')['debt_usd_value']
@@ -105,15 +133,22 @@ class PortfolioItem(AutoRepr):
         if not tokens:
             return
 
-        self.tokens = []
-        for token in tokens:
-            self.tokens.append(Token(data=token))
+        if '_lazy' in self.__dict__:
+            self._defer('tokens', tokens)
 
-        self.tokens = sorted(self.tokens, key=lambda token: token.usd_value, reverse=True)
+        else:
+            self.tokens = self._build_tokens(tokens)
 
+    @staticmethod
+    def _build_tokens(tokens: list) -> List[Token]:
+        return sorted((Token(data=token) for token in tokens), key=lambda token: token.usd_value, reverse=True)
+
+
+class Project(LazyModel):
+    def __init__(self, data: dict, lazy: bool = False):
+        if lazy:
+            self._lazy: dict = {}
 
-class Project(AutoRepr):
-    def __init__(self, data: dict):
         self.chain: str = data.get('chain')
         self.name: str = data.get('name')
         self.site_url: str = data.get('site_url')
@@ -137,20 +172,47 @@ class Project(AutoRepr):
         if not portfolio_item_list:
             return
 
+        if '_lazy' in self.__dict__:
+            self.usd_value += items_usd_value(portfolio_item_list)
+            self._defer('portfolio_item_list', portfolio_item_list)
+            return
+
         self.portfolio_item_list = []
         for portfolio_item in portfolio_item_list:
             portfolio_item = PortfolioItem(data=portfolio_item)
             self.usd_value += portfolio_item.asset_usd_value
             self.portfolio_item_list.append(portfolio_item)
 
+    @staticmethod
+    def _build_portfolio_item_list(portfolio_item_list: list) -> List[PortfolioItem]:
+        return [PortfolioItem(data=portfolio_item, lazy=True) for portfolio_item in portfolio_item_list]
+
+
+def items_usd_value(portfolio_item_list: list) -> float:
+    """
+    Get a total asset value of portfolio items without building them.
+
+    Args:
+        portfolio_item_list (list): raw portfolio items.
+
+    Returns:
+        float: the total asset value.
+
+    """
+    return sum(portfolio_item['stats']['asset_usd_value'] for portfolio_item in portfolio_item_list)
+
 
 class Collection(AutoRepr):
+    token_class = Token
+
     def __init__(self, data: dict):
         self.chain: str = data.get('chain')
         self.name: str = data.get('name')
         self.id: str = data.get('id')
         self.nft_amount: Optional[int] = data.get('amount')
-        self.spent_token: Optional[Token] = Token(data=data.get('spent_token')) if 'spent_token' in data else None
+        self.spent_token: Optional[Token] = (
+            self.token_class(data=data.get('spent_token')) if 'spent_token' in data else None
+        )
         self.avg_price_24h: float = data.get('avg_price_24h')
         self.avg_price_last_24h: float = data.get('avg_price_last_24h')
         self.floor_price: float = data.get('floor_price')
@@ -169,6 +231,8 @@ class Collection(AutoRepr):
 
 
 class NFT(AutoRepr):
+    token_class = Token
+
     def __init__(self, data: dict, collection: Optional[Collection] = None):
         self.chain: str = data.get('chain')
         self.collection: Optional[Collection] = collection
@@ -190,17 +254,17 @@ class NFT(AutoRepr):
 
         mint_gas_token = data.get('mint_gas_token')
         if mint_gas_token:
-            self.mint_gas_token = Token(data=mint_gas_token)
+            self.mint_gas_token = self.token_class(data=mint_gas_token)
             self.usd_spent += self.mint_gas_token.usd_value
 
         mint_pay_token = data.get('mint_pay_token')
         if mint_pay_token:
-            self.mint_pay_token = Token(data=mint_pay_token)
+            self.mint_pay_token = self.token_class(data=mint_pay_token)
             self.usd_spent += self.mint_pay_token.usd_value
 
         pay_token = data.get('pay_token')
         if pay_token and 'chain' in pay_token:
-            self.pay_token = Token(data=pay_token)
+            self.pay_token = self.token_class(data=pay_token)
             self.usd_spent += self.pay_token.usd_value
 
 
@@ -243,9 +307,12 @@ class ProfitLeaderboard(AutoRepr):
             self.usd_profit += profit.usd_profit
 
 
-class Chain(AutoRepr):
+class Chain(LazyModel):
     def __init__(self, name: str, tokens: Optional[list] = None, projects: Optional[list] = None,
-                 collections: Optional[list] = None):
+                 collections: Optional[list] = None, lazy: bool = False):
+        if lazy:
+            self._lazy: dict = {}
+
         self.name: str = name
         self.usd_value: float = 0.0
         self.tokens: Optional[List[Token]] = None
@@ -260,21 +327,29 @@ class Chain(AutoRepr):
         if not tokens:
             return
 
-        self.tokens = []
         for token in tokens:
             amount = token.get('amount')
             price = token.get('price')
             if amount and price:
                 self.usd_value += amount * price
 
-            self.tokens.append(Token(data=token))
+        if '_lazy' in self.__dict__:
+            self._defer('tokens', tokens)
 
-        self.tokens = sorted(self.tokens, key=lambda token: token.usd_value, reverse=True)
+        else:
+            self.tokens = self._build_tokens(tokens)
 
     def parse_projects(self, projects: list) -> None:
         if not projects:
             return
 
+        if '_lazy' in self.__dict__:
+            for project in projects:
+                self.usd_value += items_usd_value(project.get('portfolio_item_list') or [])
+
+            self._defer('projects', projects)
+            return
+
         self.projects = []
         for project in projects:
             project = Project(data=project)
@@ -287,30 +362,107 @@ class Chain(AutoRepr):
         if not collections:
             return
 
-        self.nfts = []
+        if '_lazy' in self.__dict__:
+            self._defer('nfts', collections)
+
+        else:
+            self.nfts = self._build_nfts(collections)
+
+    def has_tokens(self) -> bool:
+        """
+        Check whether the chain has tokens, in the lazy mode they aren't built.
+
+        Returns:
+            bool: True if the chain has tokens.
+
+        """
+        lazy = self.__dict__.get('_lazy')
+        if lazy and 'tokens' in lazy:
+            return bool(lazy['tokens'])
+
+        return bool(self.__dict__.get('tokens'))
+
+    def top_tokens(self, count: int) -> List[Token]:
+        """
+        Get the most valuable tokens, in the lazy mode only they are built.
+
+        Args:
+            count (int): how many tokens to get.
+
+        Returns:
+            List[Token]: the tokens.
+
+        """
+        lazy = self.__dict__.get('_lazy')
+        if lazy and 'tokens' in lazy:
+            tokens = heapq.nlargest(
+                count, lazy['tokens'], key=lambda token: (token.get('amount') or 0) * (token.get('price') or 0)
+            )
+            return self._build_tokens(tokens)
+
+        return (self.tokens or [])[:count]
+
+    @staticmethod
+    def _build_tokens(tokens: list) -> List[Token]:
+        return sorted((Token(data=token) for token in tokens), key=lambda token: token.usd_value, reverse=True)
+
+    @staticmethod
+    def _build_projects(projects: list) -> List[Project]:
+        return sorted(
+            (Project(data=project, lazy=True) for project in projects), key=lambda project: project.usd_value,
+            reverse=True
+        )
+
+    @staticmethod
+    def _build_nfts(collections: list) -> List[NFT]:
+        nfts = []
         for collection in collections:
             collection_instance = Collection(data=collection)
             for nft in collection.get('nft_list'):
-                nft = NFT(data=nft, collection=collection_instance)
-                self.nfts.append(nft)
+                nfts.append(NFT(data=nft, collection=collection_instance))
+
+        return sorted(nfts, key=lambda nft: nft.usd_spent, reverse=True)
+
+
+def chains_by_value(chain_dict: Dict[str, list], kind: str, lazy: bool = False) -> Dict[str, Chain]:
+    """
+    Build chains of grouped response items.
+
+    Args:
+        chain_dict (Dict[str, list]): tokens, projects or NFT collections by chain names.
+        kind (str): the kind of the items: 'tokens', 'projects' or 'collections'.
+        lazy (bool): if True, nested objects are built only when they are accessed. (False)
 
-        self.nfts = sorted(self.nfts, key=lambda nft: nft.usd_spent, reverse=True)
+    Returns:
+        Dict[str, Chain]: the chains sorted by USD value in descending order.
+
+    """
+    chain_list = [Chain(name=name, lazy=lazy, **{kind: items}) for name, items in chain_dict.items()]
+    return {chain.name: chain for chain in sorted(chain_list, key=lambda chain: chain.usd_value, reverse=True)}
 
 
 class NFTTx(AutoRepr):
+    token_class = Token
+    nft_class = NFT
+    collection_class = Collection
+
     def __init__(self, chain: str, data: dict):
         self.chain: str = chain
         self.type: str = data.get('type')
         self.tx_id: str = data.get('tx_id')
         self.timestamp: float = data.get('time_at')
         self.address: str = data.get('user_addr')
-        self.nft: NFT = NFT(data=data.get('nft'), collection=Collection(data=data.get('collection')))
-        self.pay_token: Token = Token(data=data.get('pay_token'))
+        self.nft: NFT = self.nft_class(
+            data=data.get('nft'), collection=self.collection_class(data=data.get('collection'))
+        )
+        self.pay_token: Token = self.token_class(data=data.get('pay_token'))
 
         self.id: str = data.get('id')
 
 
 class NFTHistory(AutoRepr):
+    tx_class = NFTTx
+
     def __init__(self, chain: str, address: str, data: dict):
         self.chain: str = chain
         self.address: str = address
@@ -325,11 +477,56 @@ class NFTHistory(AutoRepr):
 
         self.txs = []
         for tx in txs:
-            self.txs.append(NFTTx(chain=self.chain, data=tx))
+            self.txs.append(self.tx_class(chain=self.chain, data=tx))
+
+
+def nft_token_ids(token_dict: dict) -> Set[str]:
+    """
+    Find NFTs among the "token_dict" entries of a transaction history page.
+
+    Args:
+        token_dict (dict): the "token_dict" of the page.
+
+    Returns:
+        Set[str]: IDs of the entries that are NFTs, the rest are fungible tokens.
+
+    """
+    return {token_id for token_id, token in token_dict.items() if 'inner_id' in token}
 
 
 class Tx(AutoRepr):
-    def __init__(self, data: dict):
+    token_class = Token
+    nft_class = NFT
+    project_class = Project
+
+    def __init__(
+            self, data: dict, address: Optional[str] = None, token_dict: Optional[dict] = None,
+            project_dict: Optional[dict] = None, nft_ids: Optional[Set[str]] = None
+    ):
+        """
+        Initialize a transaction, the page data is only read, so it can be shared by transactions of the page.
+
+        Args:
+            data (dict): the transaction from the "history_list" of a page.
+            address (Optional[str]): the address whose history it is. (the "address" of the data)
+            token_dict (Optional[dict]): the "token_dict" of the page. (the "token_dict" of the data)
+            project_dict (Optional[dict]): the "project_dict" of the page. (the "project_dict" of the data)
+            nft_ids (Optional[Set[str]]): IDs of NFTs among the "token_dict" entries, pass them to classify
+                the entries once per page. (found by the "token_dict")
+
+        """
+        if address is None:
+            address = data.get('address')
+
+        if token_dict is None:
+            token_dict = data.get('token_dict') or {}
+
+        if project_dict is None:
+            project_dict = data.get('project_dict') or {}
+
+        if nft_ids is None:
+            nft_ids = nft_token_ids(token_dict)
+
         self.chain: str = data.get('chain')
         self.type: str = data.get('cate_id')
         self.tx_id: str = data.get('id')
@@ -356,69 +553,60 @@ class Tx(AutoRepr):
 
         if self.type == 'receive':
             self.sender = data.get('other_addr')
-            self.recipient = data.get('address')
+            self.recipient = address
 
         elif self.type == 'send':
-            self.sender = data.get('address')
+            self.sender = address
             self.recipient = data.get('other_addr')
 
-        token_dict = data.get('token_dict')
         receives = data.get('receives')
         if receives:
-            self.receives = []
-            for item in receives:
-                token = token_dict.get(item.get('token_id'))
-                token['amount'] = item.get('amount')
-                # if 'price' in token and token['price'] is None:
-                #     token['price'] = 0.0
-
-                try:
-                    token = Token(data=token)
-
-                except:
-                    pay_token = token.get('pay_token')
-                    if pay_token:
-                        token['pay_token'] = token_dict.get(pay_token.get('id'))
-
-                    token = NFT(data=token)
-
-                token.amount = item.get('amount')
-                self.receives.append(token)
+            self.receives = self._parse_transfers(transfers=receives, token_dict=token_dict, nft_ids=nft_ids)
 
         sends = data.get('sends')
         if sends:
-            self.sends = []
-            for item in sends:
-                token = token_dict.get(item.get('token_id'))
-                token['amount'] = item.get('amount')
-                # if 'price' in token and token['price'] is None:
-                #     token['price'] = 0.0
-
-                try:
-                    token = Token(data=token)
-
-                except:
-                    pay_token = token.get('pay_token')
-                    if pay_token:
-                        token['pay_token'] = token_dict.get(pay_token.get('id'))
-
-                    token = NFT(data=token)
-
-                token.amount = item.get('amount')
-                self.sends.append(token)
+            self.sends = self._parse_transfers(transfers=sends, token_dict=token_dict, nft_ids=nft_ids)
 
         token_approve = data.get('token_approve')
         if token_approve:
             token = token_dict.get(token_approve.get('token_id'))
-            token['amount'] = token_approve.get('value')
-            self.token_approve = Token(data=token)
+            if token:
+                self.token_approve = self.token_class(data={**token, 'amount': token_approve.get('value')})
 
         project_id = data.get('project_id')
-        if project_id:
-            self.project = Project(data=data.get('project_dict')[project_id])
+        if project_id and project_id in project_dict:
+            self.project = self.project_class(data=project_dict[project_id])
+
+    def _parse_transfers(self, transfers: list, token_dict: dict, nft_ids: Set[str]) -> List[Token or NFT]:
+        tokens = []
+        for item in transfers:
+            token_id = item.get('token_id')
+            token = token_dict.get(token_id)
+            if not token:
+                continue
+
+            amount = item.get('amount')
+            if token_id in nft_ids:
+                pay_token = token.get('pay_token')
+                if pay_token:
+                    token = {**token, 'pay_token': token_dict.get(pay_token.get('id'), pay_token)}
+
+                token = self.nft_class(data=token)
+                token.amount = amount
+
+            else:
+                token = self.token_class(data=token)
+                token.amount = amount
+                token.usd_value = amount * token.price if amount and token.price else 0.0
+
+            tokens.append(token)
+
+        return tokens
 
 
 class History(AutoRepr):
+    tx_class = Tx
+
     def __init__(self, address: str, data: dict):
         self.address: str = address.lower()
         self.txs: Optional[List[AutoRepr]] = None
@@ -430,11 +618,14 @@ class History(AutoRepr):
         if not txs:
             return
 
+        token_dict = data.get('token_dict') or {}
+        project_dict = data.get('project_dict') or {}
+        nft_ids = nft_token_ids(token_dict)
         self.txs = []
         for tx in txs:
-            tx.update({'address': address, 'project_dict': data.get('project_dict'),
-                       'token_dict': data.get('token_dict')})
-            self.txs.append(Tx(data=tx))
+            self.txs.append(self.tx_class(
+                data=tx, address=address, token_dict=token_dict, project_dict=project_dict, nft_ids=nft_ids
+            ))
 
 
 class User(AutoRepr):
@@ -1,12 +1,15 @@
 import asyncio
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, AsyncIterator
 
-from py_debank_async.models import Entrypoints, ChainNames, Chain, ProfitLeaderboard, NFTHistory
-from py_debank_async.utils import get_proxy, check_response, async_get, get_headers
+from py_debank_async.client import DebankClient
+from py_debank_async.jobs import poller
+from py_debank_async.models import Entrypoints, ChainNames, Chain, ProfitLeaderboard, NFTHistory, NFTTx, chains_by_value
+from py_debank_async.utils import get_proxy, check_response, async_get, get_headers, merge_descending, build
 
 
 async def collection_list(
-        address: str, chain: ChainNames or str = '', raw_data: bool = False, proxies: Optional[str or List[str]] = None
+        address: str, chain: ChainNames or str = '', raw_data: bool = False, proxies: Optional[str or List[str]] = None,
+        client: Optional[DebankClient] = None, deadline: float = 30.0, lazy: bool = False
 ) -> Dict[str, Chain] or Dict[str, dict]:
     """
     Get owned collections (raw data) or NFTs by an address.
@@ -17,6 +20,9 @@ async def collection_list(
         raw_data (bool): if True, it will return the unprocessed dictionary. (False)
         proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
             a request. (None)
+        client (Optional[DebankClient]): a client with a persistent connection pool for making a request. (None)
+        deadline (float): how many seconds to wait for DeBank to prepare the collections of all chains. (30.0)
+        lazy (bool): if True, nested objects are built only when they are accessed. (False)
 
     Returns:
         Dict[str, Chain] or Dict[str, dict]: owned collections (raw data) or NFTs.
@@ -27,58 +33,29 @@ async def collection_list(
                 'bsc': Chain(..., nfts=...)
             }
 
-    """
-    chain_dict = {}
-    if chain:
-        proxy = await get_proxy(proxy=proxies)
-        for i in range(3):
-            params = {
-                'user_addr': address,
-                'chain': chain
-            }
-            status_code, json_response = await async_get(
-                url=Entrypoints.PUBLIC.NFT + 'collection_list', params=params, headers=await get_headers(), proxy=proxy
-            )
-            await check_response(status_code=status_code, json_response=json_response)
-            if json_response['data']['job']:
-                await asyncio.sleep(3)
-
-            else:
-                chain_dict[chain] = json_response['data']['result']['data']
-                break
-
-    else:
-        chains = await used_chains(address=address, proxies=proxies)
-        for chain in chains:
-            proxy = await get_proxy(proxy=proxies)
-            for i in range(3):
-                params = {
-                    'user_addr': address,
-                    'chain': chain
-                }
-                status_code, json_response = await async_get(
-                    url=Entrypoints.PUBLIC.NFT + 'collection_list', params=params, headers=await get_headers(),
-                    proxy=proxy
-                )
-                await check_response(status_code=status_code, json_response=json_response)
-                if json_response['data']['job']:
-                    await asyncio.sleep(3)
-
-                else:
-                    chain_dict[chain] = json_response['data']['result']['data']
-                    break
+    Raises:
+        JobTimeoutException: if collections of some chains weren't prepared before the deadline.
 
+    """
+    chains = [chain] if chain else await used_chains(address=address, proxies=proxies, client=client)
+    chain_dict = await poller.poll(
+        url=Entrypoints.PUBLIC.NFT + 'collection_list', address=address, chains=chains, deadline=deadline,
+        proxies=proxies, client=client
+    )
     if not raw_data:
-        chain_list = [Chain(name=name, collections=collections) for name, collections in chain_dict.items()]
-        chain_dict = {}
-        for chain in sorted(chain_list, key=lambda chain: chain.usd_value, reverse=True):
-            chain_dict[chain.name] = chain
+        items = sum(
+            len(collection.get('nft_list') or []) for collections in chain_dict.values() for collection in collections
+        )
+        chain_dict = await build(
+            chains_by_value, items=items, client=client, chain_dict=chain_dict, kind='collections', lazy=lazy
+        )
 
     return chain_dict
 
 
 async def history_collection_list(
-        address: str, chain: ChainNames or str = '', proxies: Optional[str or List[str]] = None
+        address: str, chain: ChainNames or str = '', proxies: Optional[str or List[str]] = None,
+        client: Optional[DebankClient] = None, deadline: float = 30.0
 ) -> Dict[str, ProfitLeaderboard]:
     """
     Get a profit leaderboard for all the NFT collections the address has ever owned.
@@ -88,6 +65,8 @@ async def history_collection_list(
         chain (ChainNames or str): a chain. (all chains)
         proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
             a request. (None)
+        client (Optional[DebankClient]): a client with a persistent connection pool for making a request. (None)
+        deadline (float): how many seconds to wait for DeBank to prepare the leaderboards of all chains. (30.0)
 
     Returns:
         Dict[str, List[ProfitLeaderboard]]: the profit leaderboard.
@@ -98,48 +77,15 @@ async def history_collection_list(
                 'bsc': ProfitLeaderboard(...)
             }
 
-    """
-    profit_dict = {}
-    if chain:
-        proxy = await get_proxy(proxy=proxies)
-        for i in range(3):
-            params = {
-                'user_addr': address,
-                'chain': chain
-            }
-            status_code, json_response = await async_get(
-                url=Entrypoints.PUBLIC.NFT + 'history_collection_list', params=params, headers=await get_headers(),
-                proxy=proxy
-            )
-            await check_response(status_code=status_code, json_response=json_response)
-            if json_response['data']['job']:
-                await asyncio.sleep(3)
-
-            else:
-                profit_dict[chain] = json_response['data']['result']['data']
-                break
-
-    else:
-        chains = await used_chains(address=address, proxies=proxies)
-        for chain in chains:
-            proxy = await get_proxy(proxy=proxies)
-            for i in range(3):
-                params = {
-                    'user_addr': address,
-                    'chain': chain
-                }
-                status_code, json_response = await async_get(
-                    url=Entrypoints.PUBLIC.NFT + 'history_collection_list', params=params, headers=await get_headers(),
-                    proxy=proxy
-                )
-                await check_response(status_code=status_code, json_response=json_response)
-                if json_response['data']['job']:
-                    await asyncio.sleep(3)
-
-                else:
-                    profit_dict[chain] = json_response['data']['result']['data']
-                    break
+    Raises:
+        JobTimeoutException: if leaderboards of some chains weren't prepared before the deadline.
 
+    """
+    chains = [chain] if chain else await used_chains(address=address, proxies=proxies, client=client)
+    profit_dict = await poller.poll(
+        url=Entrypoints.PUBLIC.NFT + 'history_collection_list', address=address, chains=chains, deadline=deadline,
+        proxies=proxies, client=client
+    )
     profit_list = []
     for name, data in profit_dict.items():
         if data:
@@ -153,16 +99,18 @@ async def history_collection_list(
 
 
 async def history_list(
-        address: str, chain: ChainNames or str = '', proxies: Optional[str or List[str]] = None
+        address: str, chain: ChainNames or str = '',
+        proxies: Optional[str or List[str]] = None, client: Optional[DebankClient] = None
 ) -> Dict[str, NFTHistory] or Dict[str, dict]:
     """
-    Get a NFT transaction history of an address.
+    Get a NFT transaction history of an address, the chains are requested concurrently.
 
     Args:
         address (str): an address.
         chain (ChainNames or str): a chain. (all chains)
         proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
             a request. (None)
+        client (Optional[DebankClient]): a client with a persistent connection pool for making a request. (None)
 
     Returns:
         Dict[str, NFTHistory] or Dict[str, dict]: the NFT transaction history.
@@ -174,47 +122,126 @@ async def history_list(
             }
 
     """
-    history_dict = {}
-    if chain:
-        params = {
-            'user_addr': address,
-            'chain': chain,
-            'type': '',
-            'anchor_time': '',
-            'anchor_id': '',
-            'page_count': '20',
-            'direction': '',
-        }
-        status_code, json_response = await async_get(
-            url=Entrypoints.PUBLIC.NFT + 'history_list', params=params, headers=await get_headers(),
-            proxy=await get_proxy(proxy=proxies)
+    chains = [chain] if chain else await used_chains(address=address, proxies=proxies, client=client)
+    pages = await asyncio.gather(*(
+        history_page(address=address, chain=chain, proxies=proxies, client=client) for chain in chains
+    ))
+    return {
+        chain: NFTHistory(chain=chain, address=address, data=data) for chain, data in zip(chains, pages)
+    }
+
+
+async def iter_history(
+        address: str, chain: ChainNames or str = '', limit: Optional[int] = None, since: Optional[int] = None,
+        page_count: int = 20, proxies: Optional[str or List[str]] = None, client: Optional[DebankClient] = None
+) -> AsyncIterator[NFTTx]:
+    """
+    Iterate over a full NFT transaction history of an address page by page. The chains are requested
+    concurrently and merged into one stream.
+
+    Args:
+        address (str): an address.
+        chain (ChainNames or str): a chain. (all chains)
+        limit (Optional[int]): how many recent transactions to parse. (all transactions)
+        since (Optional[int]): a time from which to parse transactions. (all transactions)
+        page_count (int): how many transactions of a chain to request at a time, no more than 20. (20)
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request. (None)
+        client (Optional[DebankClient]): a client with a persistent connection pool for making a request. (None)
+
+    Returns:
+        AsyncIterator[NFTTx]: the transactions from newest to oldest.
+
+    """
+    chains = [chain] if chain else await used_chains(address=address, proxies=proxies, client=client)
+    iterators = [
+        _iter_chain_history(
+            address=address, chain=chain, limit=limit, since=since, page_count=page_count, proxies=proxies,
+            client=client
+        ) for chain in chains
+    ]
+    async for tx in merge_descending(
+            iterators=iterators, key=lambda tx: tx.timestamp, limit=limit, prefetch=min(page_count, 20)
+    ):
+        yield tx
+
+
+async def _iter_chain_history(
+        address: str, chain: str, limit: Optional[int], since: Optional[int], page_count: int,
+        proxies: Optional[str or List[str]], client: Optional[DebankClient]
+) -> AsyncIterator[NFTTx]:
+    page_count = min(page_count, 20)
+    anchor_time = ''
+    anchor_id = ''
+    while limit is None or limit > 0:
+        if limit is not None:
+            page_count = min(page_count, limit)
+
+        data = await history_page(
+            address=address, chain=chain, anchor_time=anchor_time, anchor_id=anchor_id, page_count=page_count,
+            proxies=proxies, client=client
         )
-        await check_response(status_code=status_code, json_response=json_response)
-        history_dict[chain] = NFTHistory(chain=chain, address=address, data=json_response['data'])
-
-    else:
-        chains = await used_chains(address=address, proxies=proxies)
-        for chain in chains:
-            params = {
-                'user_addr': address,
-                'chain': chain,
-                'type': '',
-                'anchor_time': '',
-                'anchor_id': '',
-                'page_count': '20',
-                'direction': '',
-            }
-            status_code, json_response = await async_get(
-                url=Entrypoints.PUBLIC.NFT + 'history_list', params=params, headers=await get_headers(),
-                proxy=await get_proxy(proxy=proxies)
-            )
-            await check_response(status_code=status_code, json_response=json_response)
-            history_dict[chain] = NFTHistory(chain=chain, address=address, data=json_response['data'])
+        txs = NFTHistory(chain=chain, address=address, data=data).txs
+        if not txs:
+            return
+
+        for tx in txs:
+            if since is not None and tx.timestamp < since:
+                return
+
+            yield tx
+
+        if limit is not None:
+            limit -= len(txs)
+
+        if len(txs) < page_count or (txs[-1].timestamp, txs[-1].id) == (anchor_time, anchor_id):
+            return
+
+        anchor_time = txs[-1].timestamp
+        anchor_id = txs[-1].id
+
+
+async def history_page(
+        address: str, chain: ChainNames or str, anchor_time: int or str = '', anchor_id: str = '',
+        page_count: int = 20, proxies: Optional[str or List[str]] = None, client: Optional[DebankClient] = None
+) -> dict:
+    """
+    Get a raw page of a NFT transaction history of an address.
+
+    Args:
+        address (str): an address.
+        chain (ChainNames or str): a chain.
+        anchor_time (int or str): the time of the last transaction of the previous page. (the first page)
+        anchor_id (str): the ID of the last transaction of the previous page. (the first page)
+        page_count (int): how many transactions to request, no more than 20. (20)
+        proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
+            a request. (None)
+        client (Optional[DebankClient]): a client with a persistent connection pool for making a request. (None)
 
-    return history_dict
+    Returns:
+        dict: the page.
+
+    """
+    params = {
+        'user_addr': address,
+        'chain': chain,
+        'type': '',
+        'anchor_time': str(anchor_time),
+        'anchor_id': anchor_id,
+        'page_count': str(page_count),
+        'direction': '',
+    }
+    status_code, json_response = await async_get(
+        url=Entrypoints.PUBLIC.NFT + 'history_list', params=params, headers=await get_headers(),
+        proxy=await get_proxy(proxy=proxies), client=client
+    )
+    await check_response(status_code=status_code, json_response=json_response)
+    return json_response['data']
 
 
-async def used_chains(address: str, proxies: Optional[str or List[str]] = None) -> List[str]:
+async def used_chains(
+        address: str, proxies: Optional[str or List[str]] = None, client: Optional[DebankClient] = None
+) -> List[str]:
     """
     Get chains in which there was interaction with NFT.
 
@@ -222,6 +249,7 @@ async def used_chains(address: str, proxies: Optional[str or List[str]] = None)
         address (str): an address.
         proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
             a request. (None)
+        client (Optional[DebankClient]): a client with a persistent connection pool for making a request. (None)
 
     Returns:
         List[str]: chains.
@@ -232,7 +260,7 @@ async def used_chains(address: str, proxies: Optional[str or List[str]] = None)
     }
     status_code, json_response = await async_get(
         url=Entrypoints.PUBLIC.NFT + 'used_chains', params=params, headers=await get_headers(),
-        proxy=await get_proxy(proxy=proxies)
+        proxy=await get_proxy(proxy=proxies), client=client
     )
     await check_response(status_code=status_code, json_response=json_response)
     return json_response['data']
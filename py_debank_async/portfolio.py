@@ -1,11 +1,13 @@
 from typing import Optional, Dict, List
 
-from py_debank_async.models import Entrypoints, Chain
-from py_debank_async.utils import get_proxy, check_response, async_get, get_headers
+from py_debank_async.client import DebankClient
+from py_debank_async.models import Entrypoints, Chain, chains_by_value
+from py_debank_async.utils import get_proxy, check_response, async_get, get_headers, build
 
 
 async def project_list(
-        address: str, raw_data: bool = False, proxies: Optional[str or List[str]] = None
+        address: str, raw_data: bool = False, proxies: Optional[str or List[str]] = None,
+        client: Optional[DebankClient] = None, lazy: bool = False
 ) -> Dict[str, Chain] or Dict[str, dict]:
     """
     Get projects where the account's assets are located (liquidity, staking, etc.)
@@ -15,6 +17,8 @@ async def project_list(
         raw_data (bool): if True, it will return the unprocessed dictionary. (False)
         proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
             a request. (None)
+        client (Optional[DebankClient]): a client with a persistent connection pool for making a request. (None)
+        lazy (bool): if True, nested objects are built only when they are accessed. (False)
 
     Returns:
         Dict[str, Chain] or Dict[str, dict]: projects where the account's assets are located.
@@ -31,7 +35,7 @@ async def project_list(
     }
     status_code, json_response = await async_get(
         url=Entrypoints.PUBLIC.PORTFOLIO + 'project_list', params=params, headers=await get_headers(),
-        proxy=await get_proxy(proxy=proxies)
+        proxy=await get_proxy(proxy=proxies), client=client
     )
     await check_response(status_code=status_code, json_response=json_response)
     chain_dict = {}
@@ -44,13 +48,9 @@ async def project_list(
             chain_dict[chain] = [token]
 
     if not raw_data:
-        chain_list = [Chain(name=name, projects=projects) for name, projects in chain_dict.items()]
-        chain_dict = {}
-        for chain in sorted(chain_list, key=lambda chain: chain.usd_value, reverse=True):
-            chain_dict[chain.name] = chain
-
-        chain_dict = {
-            key: value for key, value in sorted(chain_dict.items(), key=lambda item: item[1].usd_value, reverse=True)
-        }
+        items = sum(len(project.get('portfolio_item_list') or []) for project in json_response['data'])
+        chain_dict = await build(
+            chains_by_value, items=items, client=client, chain_dict=chain_dict, kind='projects', lazy=lazy
+        )
 
     return chain_dict
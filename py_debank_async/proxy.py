@@ -0,0 +1,183 @@
+import asyncio
+import random
+import time
+from typing import Optional, List, Dict
+
+from pretty_utils.type_functions.classes import AutoRepr
+
+from py_debank_async.limiter import RateLimiter
+
+
+class ProxyStats(AutoRepr):
+    def __init__(self, proxy: str, limiter: Optional[RateLimiter] = None):
+        self.proxy: str = proxy
+        self.requests: int = 0
+        self.errors: int = 0
+        self.latency: Optional[float] = None
+        self.error_rate: float = 0.0
+        self.consecutive_failures: int = 0
+        self.cooldown_until: float = 0.0
+        self.limiter: Optional[RateLimiter] = limiter
+
+
+class ProxyPool:
+    def __init__(
+            self, proxies: List[str], rate: Optional[float] = None, burst: int = 1, cooldown: float = 30.0,
+            max_cooldown: float = 600.0, smoothing: float = 0.2
+    ):
+        """
+        Initialize a pool that prefers fast and healthy proxies and rests the failing ones.
+
+        Args:
+            proxies (List[str]): HTTP proxies in the format: http://user:password@ip:port
+            rate (Optional[float]): how many requests per second are allowed through one proxy. (no limit)
+            burst (int): how many requests can be made through one proxy at once after a pause. (1)
+            cooldown (float): how many seconds a proxy rests after a "429 Too Many Requests" or a connection error,
+                it doubles with every consecutive failure. (30.0)
+            max_cooldown (float): the maximum number of seconds a proxy rests. (600.0)
+            smoothing (float): a weight of the latest request in the average latency and error rate. (0.2)
+
+        """
+        self.rate: Optional[float] = rate
+        self.burst: int = burst
+        self.cooldown: float = cooldown
+        self.max_cooldown: float = max_cooldown
+        self.smoothing: float = smoothing
+        self.stats: Dict[str, ProxyStats] = {}
+        for proxy in proxies:
+            self.add(proxy)
+
+    def __contains__(self, proxy: Optional[str]) -> bool:
+        return proxy in self.stats
+
+    def __len__(self) -> int:
+        return len(self.stats)
+
+    def add(self, proxy: str) -> None:
+        """
+        Add a proxy to the pool.
+
+        Args:
+            proxy (str): an HTTP proxy in the format: http://user:password@ip:port
+
+        """
+        if 'http' not in proxy:
+            proxy = f'http://{proxy}'
+
+        if proxy not in self.stats:
+            limiter = RateLimiter(rate=self.rate, burst=self.burst) if self.rate else None
+            self.stats[proxy] = ProxyStats(proxy=proxy, limiter=limiter)
+
+    def remove(self, proxy: str) -> None:
+        """
+        Remove a proxy from the pool.
+
+        Args:
+            proxy (str): an HTTP proxy in the format: http://user:password@ip:port
+
+        """
+        self.stats.pop(proxy, None)
+
+    def healthy(self) -> List[str]:
+        """
+        Get proxies that aren't resting now.
+
+        Returns:
+            List[str]: the proxies.
+
+        """
+        now = time.monotonic()
+        return [stats.proxy for stats in self.stats.values() if stats.cooldown_until <= now]
+
+    def _score(self, stats: ProxyStats, default_latency: float) -> float:
+        latency = stats.latency if stats.latency is not None else default_latency
+        return latency * (1 + 4 * stats.error_rate)
+
+    def _wait_time(self, now: float) -> float:
+        wait_times = []
+        for stats in self.stats.values():
+            wait_time = stats.cooldown_until - now
+            if stats.limiter:
+                wait_time = max(wait_time, stats.limiter.delay())
+
+            wait_times.append(wait_time)
+
+        return max(min(wait_times), 0.01)
+
+    async def acquire(self, exclude: Optional[str] = None) -> str:
+        """
+        Wait until a proxy is available and take it, fast proxies with few errors are chosen more often.
+
+        Args:
+            exclude (Optional[str]): a proxy that shouldn't be chosen if there are others, e.g. the one that has
+                just failed. (None)
+
+        Returns:
+            str: the proxy.
+
+        """
+        if not self.stats:
+            raise ValueError('The proxy pool is empty!')
+
+        while True:
+            now = time.monotonic()
+            candidates = [
+                stats for stats in self.stats.values()
+                if stats.cooldown_until <= now and (not stats.limiter or not stats.limiter.delay())
+            ]
+            if len(candidates) > 1 and exclude:
+                candidates = [stats for stats in candidates if stats.proxy != exclude] or candidates
+
+            if candidates:
+                latencies = [stats.latency for stats in candidates if stats.latency is not None]
+                default_latency = min(latencies) if latencies else 1.0
+                weights = [1 / max(self._score(stats, default_latency), 0.001) for stats in candidates]
+                stats = random.choices(candidates, weights=weights)[0]
+                if stats.limiter:
+                    stats.limiter.try_acquire()
+
+                return stats.proxy
+
+            await asyncio.sleep(self._wait_time(now))
+
+    def report(
+            self, proxy: str, latency: Optional[float] = None, status_code: Optional[int] = None, error: bool = False,
+            retry_after: Optional[float] = None
+    ) -> None:
+        """
+        Take into account the result of a request made through a proxy.
+
+        Args:
+            proxy (str): the proxy.
+            latency (Optional[float]): how many seconds the request took. (None)
+            status_code (Optional[int]): the request status code. (None)
+            error (bool): whether the request failed with a connection error. (False)
+            retry_after (Optional[float]): how many seconds the server asked to wait, it overrides the cooldown. (None)
+
+        """
+        stats = self.stats.get(proxy)
+        if not stats:
+            return
+
+        failed = error or status_code == 429 or (status_code is not None and status_code >= 500)
+        stats.requests += 1
+        stats.error_rate += self.smoothing * (failed - stats.error_rate)
+        if failed:
+            stats.errors += 1
+
+        elif latency is not None:
+            if stats.latency is None:
+                stats.latency = latency
+
+            else:
+                stats.latency += self.smoothing * (latency - stats.latency)
+
+        if error or status_code == 429:
+            stats.consecutive_failures += 1
+            if retry_after is None:
+                retry_after = min(self.cooldown * 2 ** (stats.consecutive_failures - 1), self.max_cooldown)
+
+            stats.cooldown_until = time.monotonic() + retry_after
+
+        elif not failed:
+            stats.consecutive_failures = 0
@@ -0,0 +1,132 @@
+import random
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+
+from pretty_utils.type_functions.classes import AutoRepr
+
+
+class RetryPolicy(AutoRepr):
+    def __init__(
+            self, attempts: int = 4, base_delay: float = 0.5, max_delay: float = 30.0,
+            statuses: Tuple[int, ...] = (429, 500, 502, 503, 504), connection_errors: bool = True,
+            respect_retry_after: bool = True
+    ):
+        """
+        Initialize a policy that defines when and how a failed request is repeated.
+
+        Args:
+            attempts (int): the maximum number of attempts including the first one. (4)
+            base_delay (float): a pause before the first retry in seconds, it doubles with every retry. (0.5)
+            max_delay (float): the maximum pause between attempts in seconds. (30.0)
+            statuses (Tuple[int, ...]): status codes that are retried. (429, 500, 502, 503, 504)
+            connection_errors (bool): whether to retry connection resets and timeouts. (True)
+            respect_retry_after (bool): whether to wait as long as the "Retry-After" header asks. (True)
+
+        """
+        self.attempts: int = attempts
+        self.base_delay: float = base_delay
+        self.max_delay: float = max_delay
+        self.statuses: Tuple[int, ...] = statuses
+        self.connection_errors: bool = connection_errors
+        self.respect_retry_after: bool = respect_retry_after
+
+    def should_retry(self, attempt: int, status_code: Optional[int] = None, error: Optional[Exception] = None) -> bool:
+        """
+        Check if a request should be repeated.
+
+        Args:
+            attempt (int): how many attempts have already been made.
+            status_code (Optional[int]): the status code of the last attempt. (None)
+            error (Optional[Exception]): a connection error of the last attempt. (None)
+
+        Returns:
+            bool: True if the request should be repeated.
+
+        """
+        if attempt >= self.attempts:
+            return False
+
+        if error:
+            return self.connection_errors
+
+        return status_code in self.statuses
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Get a pause before the next attempt using an exponential backoff with a full jitter.
+
+        Args:
+            attempt (int): how many attempts have already been made.
+            retry_after (Optional[float]): how many seconds the server asked to wait. (None)
+
+        Returns:
+            float: the pause in seconds.
+
+        """
+        if retry_after is not None and self.respect_retry_after:
+            return min(retry_after, self.max_delay)
+
+        return random.uniform(0, min(self.base_delay * 2 ** (attempt - 1), self.max_delay))
+
+
+class RetryBudget(AutoRepr):
+    def __init__(self, ratio: float = 0.2, reserve: int = 10):
+        """
+        Initialize a budget that limits retries to a share of requests, so that retry storms don't multiply load.
+
+        Args:
+            ratio (float): how many retries are earned by one request. (0.2)
+            reserve (int): how many retries are allowed regardless of the number of requests. (10)
+
+        """
+        self.ratio: float = ratio
+        self.reserve: int = reserve
+        self.balance: float = reserve
+
+    def deposit(self) -> None:
+        """
+        Earn retries for a request.
+        """
+        self.balance = min(self.balance + self.ratio, self.reserve)
+
+    def withdraw(self) -> bool:
+        """
+        Spend a retry if the budget allows it.
+
+        Returns:
+            bool: True if the retry is allowed.
+
+        """
+        if self.balance >= 1:
+            self.balance -= 1
+            return True
+
+        return False
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a "Retry-After" header.
+
+    Args:
+        value (Optional[str]): the header value, seconds or an HTTP date.
+
+    Returns:
+        Optional[float]: how many seconds to wait.
+
+    """
+    if not value:
+        return
+
+    try:
+        return max(float(value), 0.0)
+
+    except ValueError:
+        pass
+
+    try:
+        return max((parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+    except (TypeError, ValueError):
+        return
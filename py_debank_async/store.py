@@ -0,0 +1,92 @@
+import json
+import sqlite3
+import time
+from typing import Optional, Tuple, Set
+
+
+class SyncStore:
+    def __init__(self, path: str = 'debank_sync.sqlite3'):
+        """
+        Initialize an SQLite store of high-water marks of synchronized transaction histories, i.e. the time of the
+        newest seen transaction and IDs of transactions made at that time for every address and chain.
+
+        Args:
+            path (str): a path to the database file, ':memory:' keeps marks until the store is closed.
+                (debank_sync.sqlite3)
+
+        """
+        self.path: str = path
+        self._connection: sqlite3.Connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS marks '
+            '(address TEXT, chain TEXT, time_at REAL, tx_ids TEXT, updated_at REAL, PRIMARY KEY (address, chain))'
+        )
+        self._connection.commit()
+
+    def get(self, address: str, chain: str = '') -> Optional[Tuple[float, Set[str]]]:
+        """
+        Get a high-water mark.
+
+        Args:
+            address (str): an address.
+            chain (str): a chain, an empty string means all chains. ('')
+
+        Returns:
+            Optional[Tuple[float, Set[str]]]: the time of the newest seen transaction and IDs of transactions made
+                at that time or None if the history hasn't been synchronized yet.
+
+        """
+        row = self._connection.execute(
+            'SELECT time_at, tx_ids FROM marks WHERE address = ? AND chain = ?', (address.lower(), chain)
+        ).fetchone()
+        if not row:
+            return
+
+        return row[0], set(json.loads(row[1]))
+
+    def set(self, address: str, chain: str, time_at: float, tx_ids: Set[str]) -> None:
+        """
+        Save a high-water mark.
+
+        Args:
+            address (str): an address.
+            chain (str): a chain, an empty string means all chains.
+            time_at (float): the time of the newest seen transaction.
+            tx_ids (Set[str]): IDs of transactions made at that time.
+
+        """
+        self._connection.execute(
+            'INSERT OR REPLACE INTO marks (address, chain, time_at, tx_ids, updated_at) VALUES (?, ?, ?, ?, ?)',
+            (address.lower(), chain, time_at, json.dumps(sorted(tx_ids)), time.time())
+        )
+        self._connection.commit()
+
+    def reset(self, address: Optional[str] = None, chain: Optional[str] = None) -> None:
+        """
+        Forget high-water marks, so the next synchronization starts from scratch.
+
+        Args:
+            address (Optional[str]): an address. (all addresses)
+            chain (Optional[str]): a chain. (all chains)
+
+        """
+        conditions = []
+        params = []
+        if address:
+            conditions.append('address = ?')
+            params.append(address.lower())
+
+        if chain is not None:
+            conditions.append('chain = ?')
+            params.append(chain)
+
+        where = f' WHERE {" AND ".join(conditions)}' if conditions else ''
+        self._connection.execute(f'DELETE FROM marks{where}', params)
+        self._connection.commit()
+
+    def close(self) -> None:
+        """
+        Close the database.
+        """
+        self._connection.close()
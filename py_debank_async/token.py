@@ -1,11 +1,13 @@
 from typing import Optional, List, Dict
 
-from py_debank_async.models import Entrypoints, Chain, ChainNames
-from py_debank_async.utils import get_proxy, check_response, async_get, get_headers
+from py_debank_async.client import DebankClient
+from py_debank_async.models import Entrypoints, Chain, ChainNames, chains_by_value
+from py_debank_async.utils import get_proxy, check_response, async_get, get_headers, build
 
 
 async def balance_list(
-        address: str, chain: ChainNames or str, raw_data: bool = False, proxies: Optional[str or List[str]] = None
+        address: str, chain: ChainNames or str, raw_data: bool = False, proxies: Optional[str or List[str]] = None,
+        client: Optional[DebankClient] = None, lazy: bool = False
 ) -> Chain or dict:
     """
     Get token balances of an address of a certain chain.
@@ -16,6 +18,8 @@ async def balance_list(
         raw_data (bool): if True, it will return the unprocessed dictionary. (False)
         proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
             a request. (None)
+        client (Optional[DebankClient]): a client with a persistent connection pool for making a request. (None)
+        lazy (bool): if True, nested objects are built only when they are accessed. (False)
 
     Returns:
         Chain: token balances.
@@ -28,17 +32,20 @@ async def balance_list(
     }
     status_code, json_response = await async_get(
         url=Entrypoints.PUBLIC.TOKEN + 'balance_list', params=params, headers=await get_headers(),
-        proxy=await get_proxy(proxy=proxies)
+        proxy=await get_proxy(proxy=proxies), client=client
     )
     await check_response(status_code=status_code, json_response=json_response)
     if raw_data:
         return {chain: json_response['data']}
 
-    return Chain(name=chain, tokens=json_response['data'])
+    return await build(
+        Chain, items=len(json_response['data']), client=client, name=chain, tokens=json_response['data'], lazy=lazy
+    )
 
 
 async def cache_balance_list(
-        address: str, raw_data: bool = False, proxies: Optional[str or List[str]] = None
+        address: str, raw_data: bool = False, proxies: Optional[str or List[str]] = None,
+        client: Optional[DebankClient] = None, lazy: bool = False
 ) -> Dict[str, Chain] or Dict[str, dict]:
     """
     Get cached token balances of an address of all chains (current at the time of the last balance_list queries).
@@ -48,6 +55,8 @@ async def cache_balance_list(
         raw_data (bool): if True, it will return the unprocessed dictionary. (False)
         proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
             a request. (None)
+        client (Optional[DebankClient]): a client with a persistent connection pool for making a request. (None)
+        lazy (bool): if True, nested objects are built only when they are accessed. (False)
 
     Returns:
         Dict[str, Chain] or Dict[str, dict]: token balances.
@@ -64,7 +73,7 @@ async def cache_balance_list(
     }
     status_code, json_response = await async_get(
         url=Entrypoints.PUBLIC.TOKEN + 'cache_balance_list', params=params, headers=await get_headers(),
-        proxy=await get_proxy(proxy=proxies)
+        proxy=await get_proxy(proxy=proxies), client=client
     )
     await check_response(status_code=status_code, json_response=json_response)
     chain_dict = {}
@@ -77,9 +86,9 @@ async def cache_balance_list(
             chain_dict[chain] = [token]
 
     if not raw_data:
-        chain_list = [Chain(name=name, tokens=tokens) for name, tokens in chain_dict.items()]
-        chain_dict = {}
-        for chain in sorted(chain_list, key=lambda chain: chain.usd_value, reverse=True):
-            chain_dict[chain.name] = chain
+        chain_dict = await build(
+            chains_by_value, items=len(json_response['data']), client=client, chain_dict=chain_dict, kind='tokens',
+            lazy=lazy
+        )
 
     return chain_dict
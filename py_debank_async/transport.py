@@ -0,0 +1,218 @@
+import asyncio
+import json
+import os
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple, Dict, List, TextIO
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from py_debank_async.cache import ResponseCache
+from py_debank_async.exceptions import ReplayMissException
+
+
+def request_key(url: str, params: dict) -> str:
+    """
+    Get a key of a request that doesn't depend on the host, so recordings can be replayed against any base URL.
+
+    Args:
+        url (str): a URL.
+        params (dict): params of the request.
+
+    Returns:
+        str: the key, e.g. 'token/balance_list?chain=eth&user_addr=0x...'
+
+    """
+    return ResponseCache.key(endpoint=urlsplit(url).path.strip('/'), params=params)
+
+
+class Transport(ABC):
+    """
+    A way of making requests used by a DebankClient. A transport returns raw response bodies, they are parsed by
+    the client.
+    """
+
+    @property
+    def closed(self) -> bool:
+        return False
+
+    async def open(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    async def warm_up(self, url: str, connections: int = 1, proxy: Optional[str] = None) -> None:
+        pass
+
+    @abstractmethod
+    async def get(
+            self, url: str, params: dict, headers: dict, proxy: Optional[str] = None
+    ) -> Tuple[int, bytes, Optional[str]]:
+        """
+        Make a GET request.
+
+        Args:
+            url (str): a URL.
+            params (dict): params for the request.
+            headers (dict): headers for the request.
+            proxy (Optional[str]): an HTTP proxy in the format: http://user:password@ip:port (None)
+
+        Returns:
+            Tuple[int, bytes, Optional[str]]: a status code, a body and a "Retry-After" header of the response.
+
+        """
+
+
+class AiohttpTransport(Transport):
+    def __init__(
+            self, limit: int = 100, limit_per_host: int = 0, keepalive_timeout: float = 60.0,
+            ttl_dns_cache: Optional[int] = 300, timeout: Optional[float] = 30.0
+    ):
+        """
+        Initialize a transport that makes requests through an aiohttp connection pool.
+
+        Args:
+            limit (int): the maximum number of simultaneously opened connections, 0 means no limit. (100)
+            limit_per_host (int): the maximum number of simultaneously opened connections to the same host,
+                0 means no limit. (0)
+            keepalive_timeout (float): how many seconds an idle connection is kept alive. (60.0)
+            ttl_dns_cache (Optional[int]): how many seconds resolved DNS entries are cached, None means forever. (300)
+            timeout (Optional[float]): a total timeout of a request in seconds, None means no timeout. (30.0)
+
+        """
+        self.limit: int = limit
+        self.limit_per_host: int = limit_per_host
+        self.keepalive_timeout: float = keepalive_timeout
+        self.ttl_dns_cache: Optional[int] = ttl_dns_cache
+        self.timeout: Optional[float] = timeout
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def closed(self) -> bool:
+        return not self.session or self.session.closed
+
+    async def open(self) -> None:
+        if self.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit, limit_per_host=self.limit_per_host, keepalive_timeout=self.keepalive_timeout,
+                use_dns_cache=True, ttl_dns_cache=self.ttl_dns_cache
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector, timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+
+    async def close(self) -> None:
+        if not self.closed:
+            await self.session.close()
+
+        self.session = None
+
+    async def warm_up(self, url: str, connections: int = 1, proxy: Optional[str] = None) -> None:
+        await self.open()
+
+        async def touch() -> None:
+            async with self.session.head(url, proxy=proxy) as response:
+                await response.read()
+
+        await asyncio.gather(*(touch() for _ in range(connections)), return_exceptions=True)
+
+    async def get(
+            self, url: str, params: dict, headers: dict, proxy: Optional[str] = None
+    ) -> Tuple[int, bytes, Optional[str]]:
+        await self.open()
+        async with self.session.get(url, params=params, headers=headers, proxy=proxy) as response:
+            return response.status, await response.read(), response.headers.get('Retry-After')
+
+
+class RecordingTransport(Transport):
+    def __init__(self, path: str, transport: Optional[Transport] = None):
+        """
+        Initialize a transport that makes requests through another one and appends request/response pairs to
+        a JSON Lines file for the ReplayTransport.
+
+        Args:
+            path (str): a path to the file.
+            transport (Optional[Transport]): a transport that makes the requests. (AiohttpTransport)
+
+        """
+        self.path: str = path
+        self.transport: Transport = transport if transport is not None else AiohttpTransport()
+        self._file: Optional[TextIO] = None
+
+    @property
+    def closed(self) -> bool:
+        return self.transport.closed
+
+    async def open(self) -> None:
+        await self.transport.open()
+        if not self._file:
+            self._file = open(self.path, 'a', encoding='utf-8')
+
+    async def close(self) -> None:
+        await self.transport.close()
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    async def warm_up(self, url: str, connections: int = 1, proxy: Optional[str] = None) -> None:
+        await self.transport.warm_up(url=url, connections=connections, proxy=proxy)
+
+    async def get(
+            self, url: str, params: dict, headers: dict, proxy: Optional[str] = None
+    ) -> Tuple[int, bytes, Optional[str]]:
+        await self.open()
+        status, body, retry_after = await self.transport.get(url=url, params=params, headers=headers, proxy=proxy)
+        record = {
+            'key': request_key(url=url, params=params), 'status': status,
+            'body': body.decode('utf-8', errors='replace'), 'retry_after': retry_after
+        }
+        self._file.write(json.dumps(record, separators=(',', ':')) + '\n')
+        self._file.flush()
+        return status, body, retry_after
+
+
+class ReplayTransport(Transport):
+    def __init__(self, path: str):
+        """
+        Initialize a transport that serves responses recorded by the RecordingTransport without the network.
+        Responses to a repeated request are served in the recorded order, the last one is repeated after that.
+
+        Args:
+            path (str): a path to the file with recordings.
+
+        """
+        self.path: str = path
+        self.responses: Dict[str, List[Tuple[int, bytes, Optional[str]]]] = {}
+        self._positions: Dict[str, int] = {}
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as file:
+                for line in file:
+                    if not line.strip():
+                        continue
+
+                    record = json.loads(line)
+                    self.responses.setdefault(record['key'], []).append(
+                        (record['status'], record['body'].encode('utf-8'), record.get('retry_after'))
+                    )
+
+    def __len__(self) -> int:
+        return sum(len(responses) for responses in self.responses.values())
+
+    def rewind(self) -> None:
+        """
+        Serve responses to repeated requests from the first recorded one again.
+        """
+        self._positions.clear()
+
+    async def get(
+            self, url: str, params: dict, headers: dict, proxy: Optional[str] = None
+    ) -> Tuple[int, bytes, Optional[str]]:
+        key = request_key(url=url, params=params)
+        responses = self.responses.get(key)
+        if not responses:
+            raise ReplayMissException(key=key)
+
+        position = self._positions.get(key, 0)
+        self._positions[key] = min(position + 1, len(responses) - 1)
+        return responses[position]
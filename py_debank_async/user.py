@@ -1,10 +1,13 @@
 from typing import Optional, List
 
+from py_debank_async.client import DebankClient
 from py_debank_async.models import Info, User, Entrypoints
 from py_debank_async.utils import get_proxy, check_response, async_get, get_headers
 
 
-async def addr(address: str, proxies: Optional[str or List[str]] = None) -> User:
+async def addr(
+        address: str, proxies: Optional[str or List[str]] = None, client: Optional[DebankClient] = None
+) -> User:
     """
     Get a DeBank user.
 
@@ -12,6 +15,7 @@ async def addr(address: str, proxies: Optional[str or List[str]] = None) -> User
         address (str): an address.
         proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
             a request. (None)
+        client (Optional[DebankClient]): a client with a persistent connection pool for making a request. (None)
 
     Returns:
         User: the DeBank user.
@@ -22,13 +26,15 @@ async def addr(address: str, proxies: Optional[str or List[str]] = None) -> User
     }
     status_code, json_response = await async_get(
         url=Entrypoints.PUBLIC.USER + 'addr', params=params, headers=await get_headers(),
-        proxy=await get_proxy(proxy=proxies)
+        proxy=await get_proxy(proxy=proxies), client=client
     )
     await check_response(status_code=status_code, json_response=json_response)
     return User(data=json_response['data'])
 
 
-async def info(address: str, proxies: Optional[str or List[str]] = None) -> Info:
+async def info(
+        address: str, proxies: Optional[str or List[str]] = None, client: Optional[DebankClient] = None
+) -> Info:
     """
     Get an information about a DeBank user.
 
@@ -36,6 +42,7 @@ async def info(address: str, proxies: Optional[str or List[str]] = None) -> Info
         address (str): an address.
         proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
             a request. (None)
+        client (Optional[DebankClient]): a client with a persistent connection pool for making a request. (None)
 
     Returns:
         Info: the information about the DeBank user.
@@ -46,13 +53,15 @@ async def info(address: str, proxies: Optional[str or List[str]] = None) -> Info
     }
     status_code, json_response = await async_get(
         url=Entrypoints.PUBLIC.ENTRYPOINT + 'hi/user/info', params=params, headers=await get_headers(),
-        proxy=await get_proxy(proxy=proxies)
+        proxy=await get_proxy(proxy=proxies), client=client
     )
     await check_response(status_code=status_code, json_response=json_response)
     return Info(data=json_response['data'])
 
 
-async def total_balance(address: str, proxies: Optional[str or List[str]] = None) -> float:
+async def total_balance(
+        address: str, proxies: Optional[str or List[str]] = None, client: Optional[DebankClient] = None
+) -> float:
     """
     Get a total balance of an address.
 
@@ -60,6 +69,7 @@ async def total_balance(address: str, proxies: Optional[str or List[str]] = None
         address (str): an address.
         proxies (Optional[str or List[str]]): an HTTP proxy or a proxy list for random choice for making
             a request. (None)
+        client (Optional[DebankClient]): a client with a persistent connection pool for making a request. (None)
 
     Returns:
         float: the total balance.
@@ -70,7 +80,7 @@ async def total_balance(address: str, proxies: Optional[str or List[str]] = None
     }
     status_code, json_response = await async_get(
         url=Entrypoints.PUBLIC.USER + 'total_balance', params=params, headers=await get_headers(),
-        proxy=await get_proxy(proxy=proxies)
+        proxy=await get_proxy(proxy=proxies), client=client
     )
     await check_response(status_code=status_code, json_response=json_response)
     return json_response['data']['total_usd_value']
@@ -1,10 +1,17 @@
+import asyncio
+import heapq
 import random
-from typing import Optional, List, Tuple
+import time
+from typing import Optional, List, Tuple, Iterable, Awaitable, AsyncIterator, Callable, Any
 
 import aiohttp
 from fake_useragent import UserAgent
 
-from py_debank_async import exceptions
+from py_debank_async import exceptions, decoder
+from py_debank_async.client import DebankClient, endpoint_name
+from py_debank_async.instrumentation import RequestInfo, current_usage
+
+_user_agents: List[str] = []
 
 
 async def get_headers() -> dict:
@@ -15,13 +22,17 @@ async def get_headers() -> dict:
         dict: headers.
 
     """
+    if not _user_agents:
+        user_agent = UserAgent()
+        _user_agents.extend({user_agent.chrome for _ in range(50)})
+
     return {
         'accept': '*/*',
         'accept-language': 'en-US,en;q=0.9',
         'origin': 'https://debank.com',
         'referer': 'https://debank.com/',
         'source': 'web',
-        'user-agent': UserAgent().chrome
+        'user-agent': random.choice(_user_agents)
     }
 
 
@@ -70,7 +81,9 @@ async def check_response(status_code: int, json_response: dict) -> None:
         raise exceptions.DebankException(status_code=status_code, error_msg=json_response['error_msg'])
 
 
-async def async_get(url: str, params: dict, headers: dict, proxy: str) -> Tuple[int, dict]:
+async def async_get(
+        url: str, params: dict, headers: dict, proxy: str, client: Optional[DebankClient] = None
+) -> Tuple[int, dict]:
     """
     Make asynchronous GET request.
 
@@ -79,18 +92,156 @@ async def async_get(url: str, params: dict, headers: dict, proxy: str) -> Tuple[
         params (dict): params for the request.
         headers (dict): headers for the request.
         proxy (str): an HTTP proxy in the format: http://user:password@ip:port
+        client (Optional[DebankClient]): a client whose connection pool is used for the request, a one-off session
+            is opened if it isn't specified. (None)
 
     Returns:
         Tuple[int, dict]: a status code of the request and a parsed JSON dictionary.
 
     """
+    if client:
+        return await client.get(url=url, params=params, headers=headers, proxy=proxy)
+
+    info = RequestInfo(endpoint=endpoint_name(url), url=url, params=params, proxy=proxy)
     async with aiohttp.ClientSession(headers=headers) as session:
         async with session.get(url, params=params, proxy=proxy) as response:
             status = response.status
+            body = await response.read()
             if status == 200:
-                json_response = await response.json()
+                json_response = decoder.loads(body)
 
             else:
                 json_response = {}
 
-            return status, json_response
+    usage = current_usage()
+    if usage:
+        info.status_code = status
+        info.size = len(body)
+        info.elapsed = time.monotonic() - info.started_at
+        usage.add(info=info)
+
+    return status, json_response
+
+
+async def build(function: Callable[..., Any], items: int, client: Optional[DebankClient] = None, **kwargs) -> Any:
+    """
+    Build models of a response, in the executor of the client if it has one and the response is large enough.
+
+    Args:
+        function (Callable[..., Any]): a model class or a function building models.
+        items (int): the number of items of the response.
+        client (Optional[DebankClient]): a client the response was received with. (None)
+        **kwargs: arguments of the function.
+
+    Returns:
+        Any: the result of the function.
+
+    """
+    if client:
+        return await client.build(function, items=items, **kwargs)
+
+    return function(**kwargs)
+
+
+async def gather_limited(awaitables: Iterable[Awaitable], limit: int = 0) -> list:
+    """
+    Run awaitables concurrently, but no more than a certain number at a time. If one of them fails, the rest are
+    cancelled.
+
+    Args:
+        awaitables (Iterable[Awaitable]): awaitables to run.
+        limit (int): the maximum number of awaitables running at the same time, 0 means no limit. (0)
+
+    Returns:
+        list: results in the order of the awaitables.
+
+    Raises:
+        Exception: the first exception raised by an awaitable.
+
+    """
+    awaitables = list(awaitables)
+    semaphore = asyncio.Semaphore(limit) if limit > 0 else None
+
+    async def run(awaitable: Awaitable):
+        if not semaphore:
+            return await awaitable
+
+        async with semaphore:
+            return await awaitable
+
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(run(awaitable)) for awaitable in awaitables]
+
+    except ExceptionGroup as e:
+        for awaitable in awaitables:
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+
+        raise e.exceptions[0]
+
+    return [task.result() for task in tasks]
+
+
+async def merge_descending(
+        iterators: Iterable[AsyncIterator], key: Callable[[Any], float], limit: Optional[int] = None,
+        prefetch: int = 20
+) -> AsyncIterator:
+    """
+    Merge async iterators sorted in descending order into one sorted stream using a k-way heap merge. The iterators
+    are advanced concurrently, each one no more than a certain number of items ahead of the stream.
+
+    Args:
+        iterators (Iterable[AsyncIterator]): iterators of items sorted in descending order.
+        key (Callable[[Any], float]): a function getting a sort key of an item, e.g. its time.
+        limit (Optional[int]): how many items to get, the iterators are closed after that. (all items)
+        prefetch (int): how many items of an iterator can be received in advance. (20)
+
+    Returns:
+        AsyncIterator: the items in descending order.
+
+    """
+    done = object()
+
+    async def produce(iterator: AsyncIterator, queue: asyncio.Queue) -> None:
+        try:
+            async for item in iterator:
+                await queue.put((item, None))
+
+        except Exception as e:
+            await queue.put((done, e))
+            return
+
+        await queue.put((done, None))
+
+    async def receive(index: int) -> None:
+        item, error = await queues[index].get()
+        if error:
+            raise error
+
+        if item is not done:
+            heapq.heappush(heap, (-key(item), index, item))
+
+    queues = []
+    tasks = []
+    for iterator in iterators:
+        queue = asyncio.Queue(maxsize=prefetch)
+        queues.append(queue)
+        tasks.append(asyncio.create_task(produce(iterator=iterator, queue=queue)))
+
+    heap = []
+    try:
+        await asyncio.gather(*(receive(index) for index in range(len(queues))))
+        count = 0
+        while heap and (limit is None or count < limit):
+            _, index, item = heapq.heappop(heap)
+            yield item
+            count += 1
+            if limit is None or count < limit:
+                await receive(index)
+
+    finally:
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
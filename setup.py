@@ -13,8 +13,9 @@ setup(
     description='',
     long_description_content_type='text/markdown',
     long_description=long_description,
-    packages=find_packages(),
+    packages=find_packages(exclude=('benchmarks', 'benchmarks.*')),
     install_requires=['aiohttp', 'fake-useragent', 'pretty-utils @ git+https://github.com/SecorD0/pretty-utils@main'],
+    extras_require={'numpy': ['numpy'], 'orjson': ['orjson']},
     keywords=[
         'debank', 'pydebank', 'py-debank', 'debankpy', 'debank-py', 'py-debank-async', 'async-debank', 'async-py-debank'
     ],